@@ -0,0 +1,242 @@
+"""
+A render benchmark over every page of the docs app.
+
+Every concrete route registered by the page modules (as found by
+`page_sources.get_page_blocks()`), and every component and prop type
+page implied by the docs metadata, is rendered headlessly, in a single
+mock Hyperdiv session running `main.main()`, by navigating the session
+to the page's path. Each timed render is a navigation to the page from
+a blank path.
+
+For each route, this reports:
+
+* The p50, p95 and p99 render time, over `iterations` timed renders
+  that follow one warm-up render. Since the session is shared,
+  per-session caches are warm in the timed renders.
+* The number of memory blocks allocated, and the peak traced memory,
+  during one extra render with `tracemalloc` tracing, which is kept
+  separate from the timed renders so tracing doesn't skew them.
+* The number of components in the rendered tree.
+
+Results are written as JSON, and can be compared against a baseline
+run, failing when a route's render time regresses by more than a
+threshold percentage:
+
+    python -m hyperdiv_docs.benchmarks -n 20 --out before.json
+    # ... make changes ...
+    python -m hyperdiv_docs.benchmarks -n 20 --out after.json \\
+        --baseline before.json --threshold 15
+"""
+
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import tracemalloc
+from .routes import route_modules, import_route_module
+from .profiler import count_components
+
+RESULTS_VERSION = 2
+
+default_iterations = 10
+
+# A path that matches no route, which the benchmark session navigates
+# to between renders.
+blank_path = "/_benchmark/blank"
+
+# The percentage by which a route's p50 render time may grow, relative
+# to the baseline, before it counts as a regression.
+default_threshold = 20
+
+
+def get_benchmark_paths():
+    """
+    Returns the list of paths to benchmark, in a stable order.
+    """
+    from .docs_metadata import get_docs_metadata_index
+    from .page_sources import get_page_blocks
+
+    paths = [path for path in get_page_blocks() if "{" not in path]
+
+    index = get_docs_metadata_index()
+    paths += [f"/reference/components/{name}" for name in index["components"]]
+    paths += [f"/reference/prop-types/{name}" for name in index["prop_types"]]
+    return paths
+
+
+def create_runner():
+    """
+    Creates a mock Hyperdiv session running the docs app, starting on
+    `blank_path`. All the routes are rendered in this one session, so
+    per-session caches, like `static_section`, are warm as they are
+    in a real session.
+    """
+    from hyperdiv.test_utils import MockManualRunner, mock_initial_updates
+    from .main import main
+
+    initial_updates = [
+        update for update in mock_initial_updates if update[:2] != ("location", "path")
+    ]
+    runner = MockManualRunner(
+        main, initial_updates=initial_updates + [("location", "path", blank_path)]
+    )
+    runner.advance()
+    return runner
+
+
+def render_path(runner, path):
+    """
+    Navigates the session `runner` to `path`, which re-runs the docs
+    app, and returns the root component of the rendered tree.
+    """
+    runner.process_updates([("location", "path", path)])
+    return runner.app_runner.previous_root_container
+
+
+def navigate_and_render(runner, path):
+    """
+    Navigates to `blank_path` and back to `path`, and returns the time
+    taken by the navigation to `path`. Navigating away first makes
+    every render a full navigation, since re-rendering the current
+    path would do nothing.
+    """
+    render_path(runner, blank_path)
+    start = time.perf_counter()
+    render_path(runner, path)
+    return time.perf_counter() - start
+
+
+def percentile(sorted_values, p):
+    """
+    The nearest-rank `p`-th percentile of `sorted_values`.
+    """
+    rank = max(math.ceil(p / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def measure_allocations(runner, path):
+    render_path(runner, blank_path)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        render_path(runner, path)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocated_blocks = sum(
+        max(stat.count_diff, 0) for stat in after.compare_to(before, "filename")
+    )
+    return allocated_blocks, peak
+
+
+def benchmark_path(runner, path, iterations):
+    # The warm-up render.
+    render_path(runner, blank_path)
+    components = count_components(render_path(runner, path))
+
+    times = sorted(navigate_and_render(runner, path) for _ in range(iterations))
+
+    allocated_blocks, peak_bytes = measure_allocations(runner, path)
+
+    return dict(
+        p50=percentile(times, 50),
+        p95=percentile(times, 95),
+        p99=percentile(times, 99),
+        mean=sum(times) / len(times),
+        allocated_blocks=allocated_blocks,
+        peak_bytes=peak_bytes,
+        components=components,
+    )
+
+
+def run_benchmarks(iterations=default_iterations, prefix=None, log=None):
+    """
+    Benchmarks every path returned by `get_benchmark_paths()` that
+    starts with `prefix`, if given, and returns the JSON-renderable
+    results.
+    """
+    # Import all the page modules up front, so the first measured
+    # route doesn't pay for the imports.
+    for module_name in route_modules:
+        import_route_module(module_name)
+
+    runner = create_runner()
+    routes = {}
+    for path in get_benchmark_paths():
+        if prefix and not path.startswith(prefix):
+            continue
+        routes[path] = benchmark_path(runner, path, iterations)
+        if log:
+            log(f"{path}: p50={routes[path]['p50'] * 1000:.2f}ms")
+
+    return dict(
+        version=RESULTS_VERSION,
+        iterations=iterations,
+        python=platform.python_version(),
+        routes=routes,
+    )
+
+
+def compare_results(baseline, results, threshold=default_threshold):
+    """
+    Returns a list of `(path, baseline_p50, p50, change_percent)` for
+    every route whose p50 render time grew by more than `threshold`
+    percent relative to `baseline`. Routes missing from either run
+    are ignored.
+    """
+    regressions = []
+    for path, stats in results["routes"].items():
+        baseline_stats = baseline["routes"].get(path)
+        if not baseline_stats or baseline_stats["p50"] <= 0:
+            continue
+        change = (stats["p50"] - baseline_stats["p50"]) / baseline_stats["p50"] * 100
+        if change > threshold:
+            regressions.append((path, baseline_stats["p50"], stats["p50"], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m hyperdiv_docs.benchmarks",
+        description="Benchmark rendering every page of the docs app.",
+    )
+    parser.add_argument("-n", "--iterations", type=int, default=default_iterations)
+    parser.add_argument("--prefix", help="Only benchmark paths with this prefix.")
+    parser.add_argument("--out", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="A results JSON file to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=default_threshold,
+        help="The allowed p50 regression, in percent.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(iterations=args.iterations, prefix=args.prefix, log=print)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(json.dumps(results, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.loads(f.read())
+        regressions = compare_results(baseline, results, args.threshold)
+        for path, before, after, change in regressions:
+            print(
+                f"REGRESSION {path}: p50 {before * 1000:.2f}ms -> "
+                f"{after * 1000:.2f}ms (+{change:.1f}%)"
+            )
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
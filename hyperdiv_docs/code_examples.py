@@ -1,56 +1,240 @@
-import re
+import os
+import ast
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
 from textwrap import dedent as dedent_text
 import hyperdiv as hd
 from .demos.counter_plugin import counter
 from .demos.leaflet_plugin import leaflet
+from .cross_references import rewrite_references, check_references
+from .doc_chunks import get_doc_chunks
+from .outlines import split_text_sections
+from .profiler import profiled, profile_section
 
 
-def parse_doc(doc):
-    chunks = []
-    current_chunk = None
-    lines = dedent_text(doc).split("\n")
+def get_page_docs():
+    """
+    Statically collects the literal doc strings passed to
+    `docs_markdown()` in the page modules.
+    """
+    pages_path = os.path.join(os.path.dirname(__file__), "pages")
+    docs = []
 
-    inside_string = False
+    for dirpath, _, filenames in os.walk(pages_path):
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            with open(os.path.join(dirpath, filename), encoding="utf-8") as f:
+                tree = ast.parse(f.read())
+            for node in ast.walk(tree):
+                if (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Name)
+                    and node.func.id == "docs_markdown"
+                    and node.args
+                    and isinstance(node.args[0], ast.Constant)
+                    and isinstance(node.args[0].value, str)
+                ):
+                    docs.append(node.args[0].value)
 
-    def process_current_chunk():
-        if current_chunk and current_chunk["content"]:
-            chunks.append(current_chunk)
+    return docs
 
-    for line in lines:
-        stripped = line.strip()
-        if inside_string:
-            if '"""' in stripped or "'''" in stripped:
-                inside_string = False
-        else:
-            if '"""' in stripped or "'''" in stripped:
-                inside_string = True
 
-            if stripped.startswith("```py-nodemo"):
-                process_current_chunk()
-                current_chunk = dict(type="code-nodemo", content="")
-                continue
-            elif stripped.startswith("```py"):
-                process_current_chunk()
-                current_chunk = dict(type="code", content="")
-                continue
-            elif (
-                line.strip().startswith("```")
-                and current_chunk
-                and current_chunk["type"] in ("code", "code-nodemo")
-            ):
-                process_current_chunk()
-                current_chunk = dict(type="text", content="")
-                continue
-        if not current_chunk:
-            current_chunk = dict(type="text", content="")
-        current_chunk["content"] += line + "\n"
+def get_metadata_docs(data=None):
+    """
+    Collects the doc strings of components, props, methods and prop
+    types rendered by the reference pages.
+    """
+    if data is None:
+        from .docs_metadata import get_docs_metadata
+
+        data = get_docs_metadata()
+
+    docs = []
+
+    for component in data["components"].values():
+        docs.append(component.get("doc"))
+        docs.append(component.get("class_doc"))
+        for prop in component.get("props", []):
+            docs.append(prop["prop_doc"])
+        for method in component.get("methods", []):
+            docs.append(method["doc"])
+
+    for prop_type in data["prop_types"].values():
+        docs.append(prop_type["doc"])
+
+    return [doc for doc in docs if doc]
+
+
+def warm_doc_cache(include_metadata=False):
+    """
+    Pre-parses the docs of all the pages, splits them at their
+    headings, and rewrites their reference macros, so that the first
+    render of each page also does no parsing. The page docs are read
+    statically from the page sources.
+
+    If `include_metadata` is `True`, the docs of all the reference
+    metadata are warmed too. This loads the full metadata into memory,
+    so it is off by default. Reference docs are otherwise parsed, and
+    cached, when their component or prop type page is first rendered.
+    """
+    docs = get_page_docs()
+    if include_metadata:
+        docs += get_metadata_docs()
+    for doc in docs:
+        for doc_chunk in get_doc_chunks(doc):
+            if doc_chunk.type == "text":
+                rewrite_references(doc_chunk.content)
+                for section in split_text_sections(doc_chunk.content):
+                    rewrite_references(section.text)
+
+
+def check_doc_references(data=None):
+    """
+    Checks the reference macros in all page and metadata docs against
+    the docs metadata, logging a warning for each broken reference.
+    Returns the list of broken `(kind, name)` references.
+    """
+    if data is None:
+        from .docs_metadata import get_docs_metadata
+
+        data = get_docs_metadata()
+
+    texts = [
+        doc_chunk.content
+        for doc in get_page_docs() + get_metadata_docs(data)
+        for doc_chunk in get_doc_chunks(doc)
+        if doc_chunk.type == "text"
+    ]
+
+    return check_references(texts, data)
+
+
+@lru_cache(maxsize=512)
+def compile_example(code_to_execute):
+    """
+    Compiles the source of a live code example, memoized by the
+    source, so each example is compiled once per process. Returns a
+    tuple `(code_object, error)`. Compile errors are cached too, so a
+    broken example is not recompiled on every render.
+
+    Hit/miss counters are available via
+    `compile_example.cache_info()`.
+    """
+    try:
+        return compile(dedent_text(code_to_execute), "<string>", "exec"), None
+    except Exception as e:
+        return None, str(e)
+
+
+# The number of threads that run the data-producing parts of isolated
+# code examples (see `code_example`), so they never block the render
+# thread.
+example_workers = 4
 
-    process_current_chunk()
+example_executor = ThreadPoolExecutor(
+    max_workers=example_workers, thread_name_prefix="hd-docs-example"
+)
 
-    return chunks
+# The default time budget, in seconds, of a call to `run_isolated` in
+# an isolated code example.
+example_time_budget = 5
 
+# The number of calls that exceeded their time budget and are still
+# running. Threads can't be preempted, so an overrunning call keeps
+# its worker until it returns.
+overrunning_calls = 0
+overrunning_calls_lock = threading.Lock()
 
-def code_example(code, code_to_execute=None):
+
+def overrunning_call_done(future):
+    global overrunning_calls
+
+    with overrunning_calls_lock:
+        overrunning_calls -= 1
+
+
+def run_with_budget(fn, args, time_budget):
+    """
+    Runs `fn(*args)` in `example_executor`, and waits up to
+    `time_budget` seconds, counted from when the call starts running,
+    for its result.
+
+    A budget can't preempt the call: if it is exceeded, this raises
+    `TimeoutError`, but the call keeps running, and occupying its
+    worker, until it returns. To keep overrunning calls from queuing
+    up every later call behind them, new calls are refused while all
+    the workers are held by overrunning calls.
+    """
+    global overrunning_calls
+
+    with overrunning_calls_lock:
+        if overrunning_calls >= example_workers:
+            raise RuntimeError("All the example workers are busy. Try again later.")
+
+    started = threading.Event()
+
+    def run():
+        started.set()
+        return fn(*args)
+
+    future = example_executor.submit(run)
+    started.wait()
+    try:
+        return future.result(timeout=time_budget)
+    except FutureTimeoutError:
+        with overrunning_calls_lock:
+            overrunning_calls += 1
+        future.add_done_callback(overrunning_call_done)
+        raise TimeoutError(f"The example took longer than {time_budget}s to run.")
+
+
+def make_isolated_runner(time_budget):
+    """
+    Returns the `run_isolated(fn, *args)` helper available to isolated
+    code examples. It runs `fn(*args)` in `example_executor` via
+    `hd.task`, returning `None` while the call is running and the
+    call's return value once it is done. If the call fails or exceeds
+    `time_budget`, it raises, which renders the example's error UI.
+
+    Each call is scoped by its position among the example's calls,
+    `fn` and `args`, so different calls, including calls of lambdas or
+    of the same function with different arguments, get their own task.
+    """
+    num_calls = 0
+
+    def run_isolated(fn, *args):
+        nonlocal num_calls
+
+        num_calls += 1
+        with hd.scope((num_calls, fn.__qualname__, args)):
+            task = hd.task()
+            task.run(run_with_budget, fn, args, time_budget)
+            if task.error:
+                error = task.error
+                # Clear the task so it runs again when the example is
+                # reset.
+                task.clear()
+                raise RuntimeError(error)
+            return task.result
+
+    return run_isolated
+
+
+def code_example(code, code_to_execute=None, isolated=False, time_budget=None):
+    """
+    Renders `code` alongside its live output, obtained by executing
+    `code_to_execute` (defaults to `code`).
+
+    If `isolated` is `True`, the executed code can call
+    `run_isolated(fn, *args)` to run its slow, data-producing parts off
+    the render thread, in a bounded pool, with a time budget of
+    `time_budget` seconds (defaults to `example_time_budget`). In
+    `docs_markdown()`, isolated examples are written in ```py-isolated
+    fences.
+    """
     state = hd.state(error=None)
     if code_to_execute is None:
         code_to_execute = code
@@ -64,50 +248,57 @@ def code_example(code, code_to_execute=None):
                     if hd.button("Reset", size="small").clicked:
                         state.error = None
                 else:
-                    try:
-                        exec(
-                            dedent_text(code_to_execute),
-                            globals(),
-                            dict(
-                                counter=counter,
-                                leaflet=leaflet,
-                            ),
-                        )
-                    except Exception as e:
-                        state.error = str(e)
+                    code_object, error = compile_example(code_to_execute)
+                    if error:
+                        state.error = error
+                    else:
+                        example_locals = dict(counter=counter, leaflet=leaflet)
+                        if isolated:
+                            example_locals["run_isolated"] = make_isolated_runner(
+                                time_budget or example_time_budget
+                            )
+                        try:
+                            with profile_section("code_example"):
+                                exec(code_object, globals(), example_locals)
+                        except Exception as e:
+                            state.error = str(e)
+
+
+def render_text(text):
+    """
+    Renders a markdown text chunk. Each heading in the text is
+    preceded by its anchor, matching the precomputed page outlines in
+    `outlines.py`.
+    """
+    sections = split_text_sections(text)
+    if len(sections) == 1 and not sections[0].heading:
+        hd.markdown(rewrite_references(text))
+        return
+
+    with hd.box():
+        for i, section in enumerate(sections):
+            with hd.scope(i):
+                if section.heading:
+                    hd.anchor(section.heading.anchor)
+                hd.markdown(rewrite_references(section.text))
 
 
 def render_doc_chunks(doc_chunks):
     with hd.box(gap=1.5):
         for i, doc_chunk in enumerate(doc_chunks):
             with hd.scope(i):
-                if doc_chunk["content"].strip() == "":
+                if doc_chunk.content.strip() == "":
                     continue
-                if doc_chunk["type"] == "text":
-                    component_pattern = r"@component\((\w+)\)"
-                    component_replacement = r"[`\1`](/reference/components/\1)"
-
-                    prop_type_pattern = r"@prop_type\((\w+)\)"
-                    prop_type_replacement = r"[`\1`](/reference/prop-types/\1)"
-
-                    design_token_pattern = r"@design_token\((\w+)\)"
-                    design_token_replacement = r"[`\1`](/reference/design-tokens/\1)"
-
-                    new_text = re.sub(
-                        component_pattern, component_replacement, doc_chunk["content"]
-                    )
-                    new_text = re.sub(
-                        prop_type_pattern, prop_type_replacement, new_text
-                    )
-                    new_text = re.sub(
-                        design_token_pattern, design_token_replacement, new_text
-                    )
-                    hd.markdown(new_text)
-                elif doc_chunk["type"] == "code-nodemo":
-                    hd.code(doc_chunk["content"])
+                if doc_chunk.type == "text":
+                    render_text(doc_chunk.content)
+                elif doc_chunk.type == "code-nodemo":
+                    hd.code(doc_chunk.content)
+                elif doc_chunk.type == "code-isolated":
+                    code_example(doc_chunk.content, isolated=True)
                 else:
-                    code_example(doc_chunk["content"])
+                    code_example(doc_chunk.content)
 
 
+@profiled("docs_markdown")
 def docs_markdown(doc):
-    return render_doc_chunks(parse_doc(doc))
+    return render_doc_chunks(get_doc_chunks(doc))
@@ -0,0 +1,107 @@
+"""
+Cross-reference macros in doc markdown. A macro like
+`@component(box)` is rewritten into a link to the target's reference
+page, like [`box`](/reference/components/box).
+
+Reference kinds are registered with `register_reference_kind()`. All
+kinds are matched by a single combined pattern, so rewriting a chunk
+of markdown is a single pass, and the rewritten markdown is cached per
+chunk.
+"""
+
+import re
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# kind -> (href template, exists(metadata, name) or None)
+reference_kinds = {}
+
+pattern = None
+
+# The max number of rewritten chunks kept in memory, sized like the
+# parsed docs cache in `doc_chunks.py`.
+rewrite_cache_size = 2048
+
+
+def register_reference_kind(kind, href, exists=None):
+    """
+    Registers the macro `@kind(name)`, which is rewritten into a link
+    to `href.format(name=name)`.
+
+    `exists(metadata, name)`, if given, is used by
+    `find_broken_references()` to check that `name` is a valid target
+    in the docs metadata.
+    """
+    global pattern
+
+    reference_kinds[kind] = (href, exists)
+    kinds = "|".join(re.escape(k) for k in sorted(reference_kinds))
+    pattern = re.compile(rf"@({kinds})\((\w+)\)")
+    rewrite_references.cache_clear()
+
+
+def replace_reference(match):
+    kind, name = match.groups()
+    href, _ = reference_kinds[kind]
+    return f"[`{name}`]({href.format(name=name)})"
+
+
+@lru_cache(maxsize=rewrite_cache_size)
+def rewrite_references(text):
+    """
+    Rewrites all the reference macros in `text` into links.
+    """
+    if "@" not in text:
+        return text
+    return pattern.sub(replace_reference, text)
+
+
+register_reference_kind(
+    "component",
+    "/reference/components/{name}",
+    lambda metadata, name: name in metadata["components"],
+)
+register_reference_kind(
+    "prop_type",
+    "/reference/prop-types/{name}",
+    lambda metadata, name: name in metadata["prop_types"],
+)
+register_reference_kind(
+    "design_token",
+    "/reference/design-tokens/{name}",
+    lambda metadata, name: name in metadata["design_tokens"],
+)
+
+
+def find_references(text):
+    """
+    Returns a list of `(kind, name)` pairs of the macros in `text`.
+    """
+    return [match.groups() for match in pattern.finditer(text)]
+
+
+def find_broken_references(docs, metadata):
+    """
+    Returns a list of `(kind, name)` pairs of the macros in `docs`
+    whose target does not exist in `metadata`.
+    """
+    broken = []
+    for doc in docs:
+        for kind, name in find_references(doc):
+            _, exists = reference_kinds[kind]
+            if exists and not exists(metadata, name) and (kind, name) not in broken:
+                broken.append((kind, name))
+    return broken
+
+
+def check_references(docs, metadata):
+    """
+    Logs a warning for each broken reference in `docs`, and returns
+    the list of broken references.
+    """
+    broken = find_broken_references(docs, metadata)
+    for kind, name in broken:
+        logger.warning(f"Broken docs reference: @{kind}({name})")
+    return broken
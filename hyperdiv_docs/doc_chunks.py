@@ -0,0 +1,77 @@
+"""
+Parsing of doc strings into chunks of markdown text and code, which
+`code_examples.render_doc_chunks()` renders.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from textwrap import dedent as dedent_text
+
+
+def parse_doc(doc):
+    chunks = []
+    current_chunk = None
+    lines = dedent_text(doc).split("\n")
+
+    inside_string = False
+
+    def process_current_chunk():
+        if current_chunk and current_chunk["content"]:
+            chunks.append(current_chunk)
+
+    for line in lines:
+        stripped = line.strip()
+        if inside_string:
+            if '"""' in stripped or "'''" in stripped:
+                inside_string = False
+        else:
+            if '"""' in stripped or "'''" in stripped:
+                inside_string = True
+
+            if stripped.startswith("```py-nodemo"):
+                process_current_chunk()
+                current_chunk = dict(type="code-nodemo", content="")
+                continue
+            elif stripped.startswith("```py-isolated"):
+                process_current_chunk()
+                current_chunk = dict(type="code-isolated", content="")
+                continue
+            elif stripped.startswith("```py"):
+                process_current_chunk()
+                current_chunk = dict(type="code", content="")
+                continue
+            elif (
+                line.strip().startswith("```")
+                and current_chunk
+                and current_chunk["type"] in ("code", "code-nodemo", "code-isolated")
+            ):
+                process_current_chunk()
+                current_chunk = dict(type="text", content="")
+                continue
+        if not current_chunk:
+            current_chunk = dict(type="text", content="")
+        current_chunk["content"] += line + "\n"
+
+    process_current_chunk()
+
+    return chunks
+
+
+# An immutable parsed doc chunk. `type` is one of "text", "code",
+# "code-nodemo", or "code-isolated".
+DocChunk = namedtuple("DocChunk", ["type", "content"])
+
+# The max number of parsed docs kept in memory. Enough for the docs of
+# all the pages, plus the reference docs of the recently rendered
+# components and prop types.
+doc_chunks_cache_size = 2048
+
+
+@lru_cache(maxsize=doc_chunks_cache_size)
+def get_doc_chunks(doc):
+    """
+    Returns the parsed chunks of `doc` as a tuple of `DocChunk`s,
+    memoized by the doc string, so re-rendering a page does not
+    re-parse its docs.
+    """
+    return tuple(DocChunk(c["type"], c["content"]) for c in parse_doc(doc))
@@ -1,36 +1,252 @@
 import os
 import json
+import shutil
 import pathlib
+from functools import cache, lru_cache
+from .profiler import profiled
 
 metadata = None
 json_path = pathlib.Path(os.path.dirname(__file__), "docs_metadata.json")
+cache_path = pathlib.Path(os.path.dirname(__file__), "docs_metadata_cache.json")
 
+# The sharded layout of the metadata. `index.json` holds the names of
+# all components, prop types and design tokens, and each component and
+# prop type is stored in its own file under `components/` and
+# `prop_types/`.
+shards_path = pathlib.Path(os.path.dirname(__file__), "docs_metadata_shards")
 
+# The binary, mmap-able encoding of the metadata. See
+# `mapped_metadata.py`.
+binary_path = pathlib.Path(os.path.dirname(__file__), "docs_metadata.bin")
+
+# The max number of component and prop type entries kept in memory,
+# each, by the shard loaders below.
+shard_cache_size = 64
+
+
+def use_mapped_metadata():
+    """
+    Whether to serve metadata from the memory-mapped binary file,
+    which is enabled by setting the `HD_DOCS_MMAP_METADATA`
+    environment variable to `"1"` or `"true"`. When enabled, all the
+    processes serving the docs app share the same physical pages of
+    metadata, instead of each holding its own parsed copy.
+    """
+    return os.environ.get("HD_DOCS_MMAP_METADATA", "").lower() in ("1", "true")
+
+
+def resolve_markdown_refs(data):
+    """
+    Replaces, in place, each prop's `markdown_ref` with the `markdown`
+    it refers to in `data["type_markdowns"]`, so equal prop types share
+    a single string. Returns `data`.
+    """
+    type_markdowns = data.pop("type_markdowns", None)
+    if type_markdowns is None:
+        return data
+
+    for component in data["components"].values():
+        for prop in component.get("props", []):
+            prop["markdown"] = type_markdowns[prop.pop("markdown_ref")]
+    return data
+
+
+def resolve_inherited_refs(data):
+    """
+    Replaces, in place, the `{"from": defined_in, "positions": [...]}`
+    references in each component's `inherited` props, slots and style
+    parts with one `dict(defined_in, entry)` per position, where
+    `entry` is the referenced entry of the ancestor `defined_in`,
+    shared with that ancestor. Returns `data`.
+    """
+    components = data["components"]
+    for component in components.values():
+        inherited = component.get("inherited")
+        if not inherited:
+            continue
+        for kind, refs in inherited.items():
+            inherited[kind] = [
+                dict(defined_in=ref["from"], entry=components[ref["from"]][kind][i])
+                for ref in refs
+                for i in ref["positions"]
+            ]
+    return data
+
+
+def resolve_method_refs(data):
+    """
+    Replaces, in place, each component's `inherited_methods`
+    references, `{"from": defined_in, "names": [...]}`, with one
+    `dict(method_name, defined_in)` per inherited method.
+
+    Also marks each method with the reverse links, which aren't
+    stored: `overridden_in`, the components whose methods override it
+    directly, and `inherited_by`, the components that inherit it
+    without overriding it. Returns `data`.
+    """
+    components = data["components"]
+    method_tables = {
+        name: {method["method_name"]: method for method in component["methods"]}
+        for name, component in components.items()
+        if component["component_type"] == "class"
+    }
+
+    for name, component in components.items():
+        if component["component_type"] != "class":
+            continue
+        for method in component["methods"]:
+            if "overrides" in method:
+                overridden = method_tables[method["overrides"]][method["method_name"]]
+                overridden.setdefault("overridden_in", []).append(name)
+
+        inherited_methods = []
+        for ref in component.get("inherited_methods", []):
+            defined_in = ref["from"]
+            for method_name in ref["names"]:
+                inherited_methods.append(
+                    dict(method_name=method_name, defined_in=defined_in)
+                )
+                defining = method_tables[defined_in][method_name]
+                defining.setdefault("inherited_by", []).append(name)
+        component["inherited_methods"] = inherited_methods
+    return data
+
+
+def resolve_metadata(data):
+    """
+    Resolves the references in the extracted metadata `data`, as stored
+    in `json_path`, into the form used by the docs app.
+    """
+    return resolve_method_refs(resolve_inherited_refs(resolve_markdown_refs(data)))
+
+
+@profiled("get_docs_metadata")
 def get_docs_metadata():
     global metadata
 
     if metadata:
         return metadata
 
+    if use_mapped_metadata() and binary_path.exists():
+        from .mapped_metadata import load_metadata
+
+        metadata = load_metadata(binary_path)
+        return metadata
+
     if json_path.exists():
         with open(json_path) as f:
-            metadata = json.loads(f.read())
+            metadata = resolve_metadata(json.loads(f.read()))
             return metadata
     else:
         from .extractor.main import extract
 
-        metadata = extract()
+        # This may run inside the threaded server, where forking a
+        # process pool is unsafe, so extraction runs in-process. The
+        # installed package directory may not be writable, so no
+        # extraction cache is used.
+        metadata = resolve_metadata(extract(max_workers=1))
         return metadata
 
 
+def make_index(data):
+    return dict(
+        components=sorted(data["components"]),
+        prop_types={
+            name: dict(name=name, toplevel=pt["toplevel"])
+            for name, pt in data["prop_types"].items()
+        },
+        design_tokens=data["design_tokens"],
+    )
+
+
+def write_docs_metadata_shards(data):
+    """
+    Writes `data` to `shards_path` in the sharded layout.
+    """
+    if shards_path.exists():
+        shutil.rmtree(shards_path)
+
+    for kind in ("components", "prop_types"):
+        os.makedirs(shards_path / kind)
+        for name, entry in data[kind].items():
+            with open(shards_path / kind / f"{name}.json", "w") as f:
+                f.write(json.dumps(entry))
+
+    with open(shards_path / "index.json", "w") as f:
+        f.write(json.dumps(make_index(data)))
+
+
+@cache
+def get_docs_metadata_index():
+    """
+    Returns the metadata index, which lists the components, prop types
+    (with the `name` and `toplevel` fields needed to render the prop
+    types index page) and design tokens.
+
+    If the shards haven't been built, or the memory-mapped backend is
+    enabled, the index is computed from the full metadata.
+    """
+    index_path = shards_path / "index.json"
+    if index_path.exists() and not use_mapped_metadata():
+        with open(index_path) as f:
+            return json.loads(f.read())
+    return make_index(get_docs_metadata())
+
+
+def load_shard(kind, name):
+    if name not in get_docs_metadata_index()[kind]:
+        return None
+
+    shard_path = shards_path / kind / f"{name}.json"
+    if shard_path.exists() and not use_mapped_metadata():
+        with open(shard_path) as f:
+            return json.loads(f.read())
+    return get_docs_metadata()[kind].get(name)
+
+
+@lru_cache(maxsize=shard_cache_size)
+def get_component_metadata(component_name):
+    """
+    Returns the metadata of a single component, loading only that
+    component's shard. Returns `None` if there is no such component.
+    """
+    return load_shard("components", component_name)
+
+
+@lru_cache(maxsize=shard_cache_size)
+def get_prop_type_metadata(prop_type_name):
+    """
+    Returns the metadata of a single prop type, loading only that prop
+    type's shard. Returns `None` if there is no such prop type.
+    """
+    return load_shard("prop_types", prop_type_name)
+
+
 def create_docs_metadata():
     """
-    (Re)-creates the stored JSON file containing docs metadata.
+    (Re)-creates the stored JSON file containing docs metadata, the
+    sharded layout in `shards_path`, the memory-mappable binary file
+    in `binary_path`, and the full-text search index.
+
+    Per-file extraction results are cached in `cache_path`, so only
+    Hyperdiv source files that changed since the last run are
+    re-parsed.
+
+    Reference macros like `@component(box)` in the docs are checked
+    against the new metadata, and broken references are logged.
     """
     from .extractor.main import extract
+    from .mapped_metadata import compile_metadata
+    from .code_examples import check_doc_references
+    from .search import write_search_index
 
     if json_path.exists():
         os.unlink(json_path)
-    data = extract()
+    data = extract(cache_path=cache_path)
     with open(json_path, "w") as f:
         f.write(json.dumps(data, indent=2))
+    data = resolve_metadata(data)
+    write_docs_metadata_shards(data)
+    compile_metadata(data, binary_path)
+    write_search_index(data)
+    check_doc_references(data)
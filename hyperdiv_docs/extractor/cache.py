@@ -0,0 +1,115 @@
+"""
+A persistent, per-file cache of extraction results.
+
+Each entry is keyed by the path of a Hyperdiv source file and stores
+the sha256 hash of the file's contents alongside the results of the
+extraction passes that ran over that file:
+
+{
+  'version': 2,
+  'extractor_hash': '9c41f0a8...',
+  'files': {
+    '/path/to/hyperdiv/components/button.py': {
+      'hash': '3a7bd3e2...',
+      'top_level_docs': {...},
+      'class_attribute_docs': {...}
+    }
+  }
+}
+
+When a file's hash changes, all of its cached results are dropped and
+recomputed, so a rebuild after editing one file only re-parses that
+file. `extractor_hash` is a hash of the sources of this package, so
+editing the extraction code drops the whole cache.
+"""
+
+import os
+import json
+import hashlib
+import pathlib
+
+CACHE_VERSION = 2
+
+
+def get_extractor_hash():
+    """
+    Returns the sha256 hash of the sources of the extractor package.
+    """
+    extractor_hash = hashlib.sha256()
+    for file_path in sorted(pathlib.Path(__file__).parent.glob("*.py")):
+        extractor_hash.update(file_path.name.encode("utf-8"))
+        extractor_hash.update(file_path.read_bytes())
+    return extractor_hash.hexdigest()
+
+
+class ExtractionCache:
+    def __init__(self, path=None):
+        self.path = path
+        self.extractor_hash = get_extractor_hash()
+        self.files = {}
+        self.seen = set()
+        self.dirty = False
+
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.loads(f.read())
+            except (OSError, ValueError):
+                data = None
+            if (
+                data
+                and data.get("version") == CACHE_VERSION
+                and data.get("extractor_hash") == self.extractor_hash
+            ):
+                self.files = data["files"]
+
+    def read_source(self, file_path):
+        """
+        Reads `file_path` and returns a tuple `(source_code, entry)`,
+        where `entry` is the dict of cached results for the file's
+        current contents. If the file changed since it was cached, the
+        returned entry is fresh and empty.
+        """
+        with open(file_path, "rb") as f:
+            source_bytes = f.read()
+        source_hash = hashlib.sha256(source_bytes).hexdigest()
+
+        entry = self.files.get(file_path)
+        if not entry or entry["hash"] != source_hash:
+            entry = dict(hash=source_hash)
+            self.files[file_path] = entry
+            self.dirty = True
+
+        self.seen.add(file_path)
+        return source_bytes.decode("utf-8"), entry
+
+    def save(self):
+        """
+        Writes the cache to disk, dropping entries for files that were
+        not visited during this run (e.g. deleted files).
+        """
+        if not self.path:
+            return
+
+        stale = set(self.files) - self.seen
+        for file_path in stale:
+            del self.files[file_path]
+
+        if not (self.dirty or stale):
+            return
+
+        # Write to a temporary file and rename it over the cache, so an
+        # interrupted write never leaves a truncated cache behind.
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(
+                json.dumps(
+                    dict(
+                        version=CACHE_VERSION,
+                        extractor_hash=self.extractor_hash,
+                        files=self.files,
+                    )
+                )
+            )
+        os.replace(temp_path, self.path)
+        self.dirty = False
@@ -30,8 +30,6 @@ This custom parser will create a mapping like:
 
 import ast
 from .docstring_extractor import extract_docstring
-from .dirutils import get_files_recursively
-from .hyperdiv_module_path import get_hyperdiv_module_path
 
 
 class ClassAttributeVisitor(ast.NodeVisitor):
@@ -54,39 +52,3 @@ class ClassAttributeVisitor(ast.NodeVisitor):
                         if self.current_class not in self.docs:
                             self.docs[self.current_class] = {}
                         self.docs[self.current_class][item.id] = docstring
-
-
-def extract_class_attribute_docs_from_file(file_path):
-    with open(file_path, "r", encoding="utf-8") as f:
-        source_code = f.read()
-    source_lines = source_code.splitlines()
-    tree = ast.parse(source_code)
-    visitor = ClassAttributeVisitor(source_lines)
-    visitor.visit(tree)
-    return visitor.docs
-
-
-def extract_class_attribute_docs_from_files(file_paths):
-    all_docs = {}
-    for file_path in file_paths:
-        docs = extract_class_attribute_docs_from_file(file_path)
-        if docs:  # Only add entries for classes that have docs
-            all_docs.update(docs)
-    return all_docs
-
-
-def get_class_attribute_docs():
-    """
-    A dict name -> doc mapping prop names to their docs. Similar to the
-    above, but restricted to class attributes of type `Prop`.
-    """
-    hyperdiv_path = get_hyperdiv_module_path()
-
-    mixins_path = hyperdiv_path / "component_mixins"
-    components_path = hyperdiv_path / "components"
-
-    file_paths = get_files_recursively(mixins_path) + get_files_recursively(
-        components_path
-    )
-
-    return extract_class_attribute_docs_from_files(file_paths)
@@ -1,5 +1,5 @@
 import inspect
-from black import format_str, FileMode
+from functools import cache
 from hyperdiv.component_base import Component
 from hyperdiv.prop import Prop
 from hyperdiv.prop_types import (
@@ -23,11 +23,20 @@ from hyperdiv.style_part import StylePart
 from hyperdiv.design_tokens import TokenEnum
 from hyperdiv.slot import Slot
 from .types import get_types
-from .top_level_docs import get_top_level_docs
-from .class_attribute_docs import get_class_attribute_docs
+from .source_docs import get_source_docs
+from .signatures import format_signatures
 from ..utils import render_value, render_value_list
 
 
+# The kinds of class attributes extracted per component -> the key of
+# their names.
+attribute_kinds = dict(props="prop_name", slots="slot_name", style_parts="prop_name")
+
+
+def has_custom_eq(obj):
+    return type(obj).__eq__ is not object.__eq__
+
+
 class Extractor:
     """
     Extracts the core documentation metadata used to render component
@@ -37,12 +46,21 @@ class Extractor:
     This metadata can be dumped to a JSON file in a build process, so
     the docs app can just load the JSON instead of re-extracting docs
     every time it starts.
+
+    An optional `ExtractionCache` can be passed to skip re-parsing
+    Hyperdiv source files that did not change since the last run.
+    Source files are parsed in a pool of `max_workers` processes.
+
+    Component signatures are formatted in one batch by
+    `format_component_signatures()`, in fast mode if `fast_signatures`
+    is `True` (see `signatures.py`).
     """
 
-    def __init__(self):
+    def __init__(self, cache=None, max_workers=None, fast_signatures=None):
         self.types = get_types()
-        self.top_level_docs = get_top_level_docs()
-        self.class_attribute_docs = get_class_attribute_docs()
+        self.top_level_docs, self.class_attribute_docs = get_source_docs(
+            cache=cache, max_workers=max_workers
+        )
         self.parametric_types = {
             name: typ
             for name, typ in self.types.items()
@@ -52,17 +70,76 @@ class Extractor:
             and typ != CSS
         }
 
+        # Reverse indexes used by `get_type_name`. `type_names` maps the
+        # identity of each type to the position and name of its first
+        # occurrence in `self.types`. Types that override `__eq__` may
+        # also be equal to other objects, so they are kept in
+        # `eq_types`, as `(position, name, type)` triples.
+        self.type_names = {}
+        self.eq_types = []
+        for i, (name, typ) in enumerate(self.types.items()):
+            self.type_names.setdefault(id(typ), (i, name))
+            if has_custom_eq(typ):
+                self.eq_types.append((i, name, typ))
+
+        # cls -> whether `cls` is a subclass of a parametric type.
+        self.is_parametric_cache = {}
+
+        # Component class name -> dict method_name -> method info, of
+        # the methods defined by that class.
+        self.method_tables = {}
+
+        # Component class name -> dict kind -> dict name -> position,
+        # of the props, slots and style parts defined by that class,
+        # where kind is one of `attribute_kinds`.
+        self.attribute_tables = {}
+
+        # Unformatted signature -> (name, inspect.Signature) of every
+        # extracted component.
+        self.signatures = {}
+        self.fast_signatures = fast_signatures
+
+        # Each distinct prop type Markdown is stored once, in
+        # `type_markdowns`, and props refer to it by its position.
         self.output = dict(
             prop_types=dict(),
             design_tokens=[],
             components={},
+            type_markdowns=[],
         )
+        # Markdown -> its position in `type_markdowns`.
+        self.markdown_refs = {}
+
+        # (id(prop_type), lookup_alias) -> (prop_type, fingerprint).
+        # The prop type is kept so that its id isn't reused.
+        self.fingerprints = {}
 
     def is_parametric(self, cls):
-        for name, typ in self.parametric_types.items():
-            if issubclass(cls, typ):
-                return True
-        return False
+        if cls not in self.is_parametric_cache:
+            self.is_parametric_cache[cls] = any(
+                issubclass(cls, typ) for typ in self.parametric_types.values()
+            )
+        return self.is_parametric_cache[cls]
+
+    def get_type_name(self, typ):
+        """
+        Returns the name of the first type in `self.types` that is
+        equal to `typ`, or `None`.
+        """
+        if has_custom_eq(typ):
+            # `typ == v` may hold for any `v`.
+            for name, v in self.types.items():
+                if typ == v:
+                    return name
+            return None
+
+        i, name = self.type_names.get(id(typ), (len(self.types), None))
+        for j, eq_name, v in self.eq_types:
+            if j >= i:
+                break
+            if typ == v:
+                return eq_name
+        return name
 
     def get_prop_type_doc(self, typ):
         """
@@ -90,11 +167,7 @@ class Extractor:
         In this case, the doc for `MyType` will be grabbed from its
         class definition.  The doc for `MyType` will be 'My docs'.
         """
-        name = None
-        for k, v in self.types.items():
-            if typ == v:
-                name = k
-                break
+        name = self.get_type_name(typ)
         if name:
             typ = self.types.get(name)
 
@@ -151,14 +224,20 @@ class Extractor:
             toplevel=toplevel,
         )
 
-    def format_code(self, code_text):
-        try:
-            return format_str(code_text, mode=FileMode())
-        except Exception:
-            return code_text
+    def format_component_signatures(self):
+        """
+        Replaces the unformatted signatures of all the components in
+        `self.output` with their formatted versions, formatting them
+        in one batch.
+        """
+        formatted = format_signatures(self.signatures, fast=self.fast_signatures)
+        for component in self.output["components"].values():
+            component["sig"] = formatted.get(component["sig"], component["sig"])
 
     def get_component_signature(self, klass_or_fn):
-        sig = f"{klass_or_fn.__name__}{str(inspect.signature(klass_or_fn))}"
+        signature = inspect.signature(klass_or_fn)
+        sig = f"{klass_or_fn.__name__}{str(signature)}"
+        self.signatures[sig] = (klass_or_fn.__name__, signature)
         if inspect.isclass(klass_or_fn):
             return sig, klass_or_fn.__init__.__doc__
         else:
@@ -175,8 +254,9 @@ class Extractor:
         if comp.__name__ in self.output["components"]:
             return
 
+        # The signature is formatted later, by
+        # `format_component_signatures()`.
         sig, doc = self.get_component_signature(comp)
-        sig = self.format_code(sig)
 
         is_class = inspect.isclass(comp)
 
@@ -222,7 +302,7 @@ class Extractor:
                             prop_name=attr.name,
                             default_value=attr.default_value,
                             immutable=attr.backend_immutable,
-                            markdown=markdown,
+                            markdown_ref=self.get_markdown_ref(markdown),
                             prop_doc=prop_doc,
                         )
                     )
@@ -264,26 +344,13 @@ class Extractor:
                 # Recursively extract info for each superclass
                 self.extract_component(base)
                 if base.__name__ in self.output["components"]:
-                    # If the current class overrides any methods from
-                    # the superclass, mark each of those methods with
-                    # the superclass whose method it overrides.
-                    superclass_methods = self.output["components"][base.__name__][
-                        "methods"
-                    ]
-                    for m in superclass_methods:
-                        overridden_method = next(
-                            (
-                                method
-                                for method in methods
-                                if method["method_name"] == m["method_name"]
-                            ),
-                            None,
-                        )
-                        if overridden_method:
-                            overridden_method["overrides"] = base.__name__
-
                     superclasses.append(base.__name__)
 
+        inherited_methods = self.resolve_method_overrides(comp, methods)
+        inherited = self.resolve_inherited_attributes(
+            comp, dict(props=props, slots=slots, style_parts=style_parts)
+        )
+
         self.output["components"][comp.__name__] = dict(
             component_type="class",
             sig=sig,
@@ -294,15 +361,116 @@ class Extractor:
             style_parts=style_parts,
             slots=slots,
             methods=methods,
+            inherited_methods=inherited_methods,
+            inherited=inherited,
             superclasses=superclasses,
             is_mixin=is_mixin,
         )
 
-    def get_prop_type_markdown(self, prop_type, lookup_alias=True):
+    def resolve_method_overrides(self, comp, methods):
         """
-        Recursively compiles `prop_type` to Markdown where each type is
-        compiled to a link to its docs page.
+        Resolves the methods of the component class `comp`, whose own
+        methods are `methods`, against the method tables of its
+        extracted ancestors, in MRO order.
+
+        Each method of `comp` that overrides an ancestor's method is
+        marked with `overrides`, the nearest ancestor defining it, and
+        `override_chain`, all the ancestors defining it, nearest
+        first. Returns the methods `comp` inherits without overriding
+        them, as a list of `{"from": defined_in, "names": [...]}`
+        references to the ancestors defining them, in MRO order.
+        """
+        ancestors = [
+            cls.__name__
+            for cls in comp.__mro__[1:]
+            if cls.__name__ in self.method_tables
+        ]
+
+        for method in methods:
+            chain = [
+                name
+                for name in ancestors
+                if method["method_name"] in self.method_tables[name]
+            ]
+            if chain:
+                method["overrides"] = chain[0]
+                method["override_chain"] = chain
+
+        own_methods = {method["method_name"]: method for method in methods}
+        seen = set(own_methods)
+        inherited = []
+        for name in ancestors:
+            names = [
+                method_name
+                for method_name in self.method_tables[name]
+                if method_name not in seen
+            ]
+            if names:
+                seen.update(names)
+                inherited.append({"from": name, "names": names})
+
+        self.method_tables[comp.__name__] = own_methods
+
+        return inherited
+
+    def resolve_inherited_attributes(self, comp, attributes):
+        """
+        Flattens the props, slots and style parts that the component
+        class `comp` inherits from its extracted ancestors, given its
+        own `attributes`, a dict kind -> list of entries.
+
+        Returns a dict kind -> list of `{"from": defined_in,
+        "positions": [...]}` references to the entries at `positions`
+        in the `kind` list of the ancestor `defined_in`, in MRO order.
+        Attributes redefined by a nearer class are taken from that
+        class.
+        """
+        ancestors = [
+            cls.__name__
+            for cls in comp.__mro__[1:]
+            if cls.__name__ in self.attribute_tables
+        ]
+
+        own_tables = {
+            kind: {entry[name_key]: i for i, entry in enumerate(attributes[kind])}
+            for kind, name_key in attribute_kinds.items()
+        }
+        self.attribute_tables[comp.__name__] = own_tables
+
+        inherited = {}
+        for kind in attribute_kinds:
+            seen = set(own_tables[kind])
+            inherited[kind] = []
+            for name in ancestors:
+                positions = []
+                for attribute_name, i in self.attribute_tables[name][kind].items():
+                    if attribute_name not in seen:
+                        seen.add(attribute_name)
+                        positions.append(i)
+                if positions:
+                    inherited[kind].append({"from": name, "positions": positions})
+        return inherited
+
+    def get_prop_type_fingerprint(self, prop_type, lookup_alias=True):
+        """
+        Returns a hashable, canonical description of `prop_type`'s
+        structure, from which its Markdown is compiled by
+        `compile_fingerprint_markdown`. Structurally equal prop types
+        have equal fingerprints.
+
+        If `lookup_alias` is `True` and `prop_type` is a named type,
+        the fingerprint is just the type's name.
+
+        Fingerprints are memoized per prop type object.
         """
+        key = (id(prop_type), lookup_alias)
+        cached = self.fingerprints.get(key)
+        if cached is None:
+            fingerprint = self.compute_prop_type_fingerprint(prop_type, lookup_alias)
+            cached = self.fingerprints[key] = (prop_type, fingerprint)
+        return cached[1]
+
+    def compute_prop_type_fingerprint(self, prop_type, lookup_alias):
         if isinstance(prop_type, CSSField):
             prop_type = prop_type.typ
 
@@ -310,85 +478,118 @@ class Extractor:
             doc = self.get_prop_type_doc(prop_type)
 
             if doc:
-                name = doc["name"]
-                return f"[{name}](/reference/prop-types/{name})"
-
-        def make_link(prop_type_class):
-            name = prop_type_class.__name__
-            return f"[{name}](/reference/prop-types/{name})"
+                return ("name", doc["name"])
 
         if isinstance(prop_type, Optional):
-            return (
-                make_link(Optional)
-                + "("
-                + self.get_prop_type_markdown(prop_type.typ)
-                + ")"
-            )
+            return (Optional.__name__, self.get_prop_type_fingerprint(prop_type.typ))
         elif isinstance(prop_type, OneOf):
-            return make_link(OneOf) + "(" + render_value_list(prop_type.values) + ")"
+            return (OneOf.__name__, render_value_list(prop_type.values))
         elif isinstance(prop_type, OneOrMoreOf):
-            return (
-                make_link(OneOrMoreOf) + "(" + render_value_list(prop_type.values) + ")"
-            )
+            return (OneOrMoreOf.__name__, render_value_list(prop_type.values))
         elif isinstance(prop_type, CSSField):
-            return self.get_prop_type_markdown(prop_type.typ)
+            return self.get_prop_type_fingerprint(prop_type.typ)
         elif isinstance(prop_type, DesignToken):
-            link = make_link(DesignToken)
-            enum_name = prop_type.enum.__name__
-            return f"{link}([{enum_name}](/reference/design-tokens/{enum_name}))"
+            return (DesignToken.__name__, prop_type.enum.__name__)
         elif isinstance(prop_type, Event):
+            return (Event.__name__, self.get_prop_type_fingerprint(prop_type.typ))
+        elif isinstance(prop_type, Union):
             return (
-                make_link(Event)
-                + "("
-                + self.get_prop_type_markdown(prop_type.typ)
-                + ")"
+                Union.__name__,
+                self.get_prop_type_fingerprint(prop_type.typ1),
+                self.get_prop_type_fingerprint(prop_type.typ2),
             )
-        elif isinstance(prop_type, Union):
-            link = make_link(Union)
-            typ1_md = self.get_prop_type_markdown(prop_type.typ1)
-            typ2_md = self.get_prop_type_markdown(prop_type.typ2)
-            return f"{link}({typ1_md}, {typ2_md})"
         elif isinstance(prop_type, Native):
-            link = make_link(Native)
-            typ = prop_type.typ.__name__
-            args = [typ]
+            args = [prop_type.typ.__name__]
             if prop_type.coercible_types:
                 args.append(
                     "coercible_types=["
                     + ", ".join([t.__name__ for t in prop_type.coercible_types])
                     + "]"
                 )
-            args = ", ".join(args)
-            return f"{link}({args})"
+            return (Native.__name__, ", ".join(args))
         elif isinstance(prop_type, StylePart):
-            return make_link(StylePart)
+            return (StylePart.__name__,)
         elif isinstance(prop_type, ClampedNumber):
-            typ_md = None
-            if isinstance(prop_type, ClampedInt):
-                link = make_link(ClampedInt)
-            elif isinstance(prop_type, ClampedFloat):
-                link = make_link(ClampedFloat)
-            else:
-                link = make_link(ClampedNumber)
-                typ_md = self.get_prop_type_markdown(prop_type.typ)
             args = []
             if prop_type.low is not None:
                 args.append(f"low={prop_type.low}")
             if prop_type.high is not None:
                 args.append(f"high={prop_type.high}")
             args_str = ", ".join(args)
-            if typ_md:
-                return f"{link}({typ_md}, {args_str})"
-            else:
-                return f"{link}({args_str})"
+            if isinstance(prop_type, ClampedInt):
+                return (ClampedInt.__name__, args_str)
+            elif isinstance(prop_type, ClampedFloat):
+                return (ClampedFloat.__name__, args_str)
+            return (
+                ClampedNumber.__name__,
+                self.get_prop_type_fingerprint(prop_type.typ),
+                args_str,
+            )
         elif isinstance(prop_type, Constant):
-            link = make_link(Constant)
-            const = prop_type.constant
-            return f"{link}({repr(const)})"
+            return (Constant.__name__, repr(prop_type.constant))
         elif isinstance(prop_type, List):
-            link = make_link(List)
-            typ_md = self.get_prop_type_markdown(prop_type.typ)
-            return f"{link}({typ_md})"
+            return (List.__name__, self.get_prop_type_fingerprint(prop_type.typ))
+
+        return ("name", repr(prop_type))
 
-        name = repr(prop_type)
-        return f"[{name}](/reference/prop-types/{name})"
+    def get_prop_type_markdown(self, prop_type, lookup_alias=True):
+        """
+        Recursively compiles `prop_type` to Markdown where each type is
+        compiled to a link to its docs page.
+
+        The Markdown is compiled from the type's fingerprint, so each
+        distinct type expression is compiled once.
+        """
+        return compile_fingerprint_markdown(
+            self.get_prop_type_fingerprint(prop_type, lookup_alias=lookup_alias)
+        )
+
+    def get_markdown_ref(self, markdown):
+        """
+        Returns the position of `markdown` in
+        `self.output["type_markdowns"]`, adding it if it's new.
+        """
+        ref = self.markdown_refs.get(markdown)
+        if ref is None:
+            ref = len(self.output["type_markdowns"])
+            self.output["type_markdowns"].append(markdown)
+            self.markdown_refs[markdown] = ref
+        return ref
+
+
+def make_link(name):
+    return f"[{name}](/reference/prop-types/{name})"
+
+
+@cache
+def compile_fingerprint_markdown(fingerprint):
+    """
+    Compiles a fingerprint returned by
+    `Extractor.get_prop_type_fingerprint` to Markdown.
+    """
+    kind, *args = fingerprint
+
+    if kind == "name":
+        return make_link(args[0])
+    elif kind in (
+        Optional.__name__,
+        Event.__name__,
+        List.__name__,
+    ):
+        return f"{make_link(kind)}({compile_fingerprint_markdown(args[0])})"
+    elif kind == DesignToken.__name__:
+        enum_name = args[0]
+        return f"{make_link(kind)}([{enum_name}](/reference/design-tokens/{enum_name}))"
+    elif kind == Union.__name__:
+        typ1_md = compile_fingerprint_markdown(args[0])
+        typ2_md = compile_fingerprint_markdown(args[1])
+        return f"{make_link(kind)}({typ1_md}, {typ2_md})"
+    elif kind == StylePart.__name__:
+        return make_link(kind)
+    elif kind == ClampedNumber.__name__:
+        typ_md = compile_fingerprint_markdown(args[0])
+        return f"{make_link(kind)}({typ_md}, {args[1]})"
+    else:
+        # OneOf, OneOrMoreOf, Native, ClampedInt, ClampedFloat and
+        # Constant, whose arguments are already rendered.
+        return f"{make_link(kind)}({args[0]})"
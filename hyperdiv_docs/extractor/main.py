@@ -2,15 +2,29 @@ import inspect
 import hyperdiv as hd
 from hyperdiv.prop_types import HyperdivType
 from .extractor import Extractor
+from .cache import ExtractionCache
 
 
-def extract():
+def extract(cache_path=None, max_workers=None, fast_signatures=None):
     """
     Extracts metadata from the Hyperdiv repo, which is used to
     dynamically render the docs components and prop types pages.
+
+    If `cache_path` is given, per-file parse results are persisted
+    there, keyed by file content hash, and reused on the next run.
+
+    Source files are parsed in a pool of `max_workers` processes,
+    defaulting to the number of CPUs.
+
+    Component signatures are formatted with black, or, if
+    `fast_signatures` is `True` or black isn't installed, with a
+    lightweight printer (see `signatures.py`).
     """
 
-    ctx = Extractor()
+    cache = ExtractionCache(cache_path) if cache_path else None
+    ctx = Extractor(
+        cache=cache, max_workers=max_workers, fast_signatures=fast_signatures
+    )
 
     # Iterate over all the attributes exported by `hyperdiv`
     for name, attr in vars(hd).items():
@@ -52,4 +66,9 @@ def extract():
     for typ in ctx.types.values():
         ctx.extract_prop_type(typ)
 
+    ctx.format_component_signatures()
+
+    if cache:
+        cache.save()
+
     return ctx.output
@@ -0,0 +1,177 @@
+"""
+Formatting of component signatures, like `box(*children, gap=None)`.
+
+Signatures are formatted in one batch with `black`: all the signatures
+are joined into a single source, separated by marker comments, which
+is formatted with one `black.format_str` call and split back up. The
+result of each signature is cached by the signature string.
+
+If `black` isn't installed, or fast mode is requested (by passing
+`fast=True` or setting the `HD_DOCS_FAST_SIGNATURES` environment
+variable to `"1"` or `"true"`), signatures are formatted by
+`pretty_print_signature`, a lightweight printer that approximates
+black's output from the signature's `inspect.Signature`, without
+importing black.
+"""
+
+import os
+import re
+import ast
+import inspect
+
+line_length = 88
+indent = "    "
+
+marker_prefix = "# hd-docs-signature-"
+marker_pattern = re.compile(r"^# hd-docs-signature-\d+$", re.MULTILINE)
+
+# (signature string, whether it was formatted in fast mode) ->
+# formatted signature
+formatted_signatures = {}
+
+
+def fast_signatures_enabled():
+    return os.environ.get("HD_DOCS_FAST_SIGNATURES", "").lower() in ("1", "true")
+
+
+def get_black():
+    try:
+        import black
+    except ImportError:
+        return None
+    return black
+
+
+def get_parameter_strings(signature):
+    """
+    Returns the parameters of `signature` as a list of strings, with
+    the `/` and `*` separators, as rendered by `str(signature)`.
+    """
+    params = []
+    render_pos_only_separator = False
+    render_kw_only_separator = True
+
+    for param in signature.parameters.values():
+        kind = param.kind
+
+        if kind == inspect.Parameter.POSITIONAL_ONLY:
+            render_pos_only_separator = True
+        elif render_pos_only_separator:
+            params.append("/")
+            render_pos_only_separator = False
+
+        if kind == inspect.Parameter.VAR_POSITIONAL:
+            render_kw_only_separator = False
+        elif kind == inspect.Parameter.KEYWORD_ONLY and render_kw_only_separator:
+            params.append("*")
+            render_kw_only_separator = False
+
+        params.append(str(param))
+
+    if render_pos_only_separator:
+        params.append("/")
+
+    return params
+
+
+def pretty_print_signature(name, signature):
+    """
+    Formats `name` and its `inspect.Signature` the way black formats a
+    call: on one line if it fits, otherwise with the parameters on one
+    indented line if that fits, otherwise one parameter per line.
+
+    Like black, signatures that aren't valid Python calls (e.g. with
+    annotations) are returned unchanged, and exploded parameter lists
+    get a trailing comma unless they contain `*` or `**` unpacking.
+    Unlike black, string quotes are not normalized.
+    """
+    params = get_parameter_strings(signature)
+    one_line = f"{name}({', '.join(params)})"
+    if signature.return_annotation is not inspect.Signature.empty:
+        one_line += f" -> {inspect.formatannotation(signature.return_annotation)}"
+
+    try:
+        ast.parse(one_line)
+    except SyntaxError:
+        return one_line
+
+    if len(one_line) <= line_length:
+        return one_line + "\n"
+
+    params_line = indent + ", ".join(params)
+    if len(params_line) <= line_length:
+        return f"{name}(\n{params_line}\n)\n"
+
+    trailing_comma = "" if any(p.startswith("*") for p in params) else ","
+    lines = ",\n".join(f"{indent}{param}" for param in params)
+    return f"{name}(\n{lines}{trailing_comma}\n)\n"
+
+
+def format_with_black(black, code_text):
+    try:
+        return black.format_str(code_text, mode=black.FileMode())
+    except Exception:
+        return code_text
+
+
+def format_batch_with_black(black, signatures):
+    """
+    Formats `signatures` with a single black invocation, returning a
+    dict signature -> formatted signature. Signatures that aren't
+    valid Python are returned unchanged, as black would fail on them.
+    """
+    results = {}
+    batch = []
+    for signature in signatures:
+        try:
+            ast.parse(signature)
+        except SyntaxError:
+            results[signature] = signature
+        else:
+            batch.append(signature)
+
+    if not batch:
+        return results
+
+    source = "".join(
+        f"{marker_prefix}{i}\n{signature}\n" for i, signature in enumerate(batch)
+    )
+    try:
+        formatted = black.format_str(source, mode=black.FileMode())
+    except Exception:
+        formatted = None
+
+    pieces = marker_pattern.split(formatted)[1:] if formatted else []
+    if len(pieces) != len(batch):
+        # Fall back to formatting each signature on its own.
+        for signature in batch:
+            results[signature] = format_with_black(black, signature)
+        return results
+
+    for signature, piece in zip(batch, pieces):
+        results[signature] = piece.strip("\n") + "\n"
+    return results
+
+
+def format_signatures(signatures, fast=None):
+    """
+    Formats the given signatures, and returns a dict signature ->
+    formatted signature. `signatures` is a dict mapping each signature
+    string to a `(name, inspect.Signature)` pair, which is used by the
+    fast printer.
+    """
+    if fast is None:
+        fast = fast_signatures_enabled()
+
+    black = None if fast else get_black()
+    pending = [s for s in signatures if (s, black is None) not in formatted_signatures]
+
+    if black:
+        for signature, formatted in format_batch_with_black(black, pending).items():
+            formatted_signatures[(signature, False)] = formatted
+    else:
+        for signature in pending:
+            name, sig = signatures[signature]
+            formatted_signatures[(signature, True)] = pretty_print_signature(name, sig)
+
+    return {s: formatted_signatures[(s, black is None)] for s in signatures}
@@ -0,0 +1,133 @@
+"""
+A single-pass source doc extractor. Each Hyperdiv source file is read
+and parsed once, producing both its top-level docs (see
+`top_level_docs.py`) and its class attribute docs (see
+`class_attribute_docs.py`).
+
+Files that need parsing are fanned out over a process pool. Results
+are merged in file order, so the output is the same as the sequential
+passes regardless of which worker finishes first.
+"""
+
+import os
+import ast
+import symtable
+from concurrent.futures import ProcessPoolExecutor
+from .top_level_docs import TopLevelAssignmentVisitor
+from .class_attribute_docs import ClassAttributeVisitor
+from .dirutils import get_files_recursively
+from .hyperdiv_module_path import get_hyperdiv_module_path
+
+
+def extract_docs_from_source(source_code):
+    """
+    Returns a tuple `(top_level_docs, class_attribute_docs)` for the
+    given source code, parsing it only once.
+    """
+    source_lines = source_code.splitlines()
+    tree = ast.parse(source_code)
+    sym_table = symtable.symtable(source_code, "<string>", "exec")
+
+    top_level_visitor = TopLevelAssignmentVisitor(source_lines, sym_table)
+    top_level_visitor.visit(tree)
+
+    class_attribute_visitor = ClassAttributeVisitor(source_lines)
+    class_attribute_visitor.visit(tree)
+
+    return top_level_visitor.docs, class_attribute_visitor.docs
+
+
+def get_source_files():
+    """
+    Returns a list of `(file_path, collect_class_attribute_docs)`
+    pairs, in the order in which their docs are merged.
+    """
+    hyperdiv_path = get_hyperdiv_module_path()
+
+    return (
+        [(f, False) for f in get_files_recursively(hyperdiv_path / "prop_types")]
+        + [
+            (f, True)
+            for f in get_files_recursively(hyperdiv_path / "component_mixins")
+        ]
+        + [(f, True) for f in get_files_recursively(hyperdiv_path / "components")]
+    )
+
+
+def extract_docs_from_files(files, cache=None, max_workers=None):
+    """
+    Extracts `(top_level_docs, class_attribute_docs)` from `files`, a
+    list of pairs as returned by `get_source_files()`.
+
+    Files whose results are in `cache` are not re-parsed. The rest are
+    parsed in a process pool of `max_workers` processes (defaults to
+    the number of CPUs). Passing `max_workers=1` parses in-process.
+    """
+    results = [None] * len(files)
+    pending = []
+
+    for i, (file_path, _) in enumerate(files):
+        entry = None
+        if cache:
+            source_code, entry = cache.read_source(file_path)
+            if "top_level_docs" in entry and "class_attribute_docs" in entry:
+                results[i] = (entry["top_level_docs"], entry["class_attribute_docs"])
+                continue
+        else:
+            with open(file_path, "r", encoding="utf-8") as f:
+                source_code = f.read()
+        pending.append((i, source_code, entry))
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    sources = [source_code for _, source_code, _ in pending]
+
+    if max_workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            parsed = list(pool.map(extract_docs_from_source, sources))
+    else:
+        parsed = [extract_docs_from_source(source_code) for source_code in sources]
+
+    for (i, _, entry), (top_level, class_attributes) in zip(pending, parsed):
+        results[i] = (top_level, class_attributes)
+        if entry is not None:
+            entry["top_level_docs"] = top_level
+            entry["class_attribute_docs"] = class_attributes
+            cache.dirty = True
+
+    all_top_level_docs = {}
+    all_class_attribute_docs = {}
+
+    for (_, collect_class_attribute_docs), (top_level, class_attributes) in zip(
+        files, results
+    ):
+        all_top_level_docs.update(top_level)
+        if collect_class_attribute_docs:
+            all_class_attribute_docs.update(class_attributes)
+
+    return all_top_level_docs, all_class_attribute_docs
+
+
+def get_source_docs(cache=None, max_workers=None):
+    """
+    Returns `(top_level_docs, class_attribute_docs)` for all Hyperdiv
+    component files, reading and parsing each file only once.
+
+    `top_level_docs` is a dict mapping top-level names to their docs,
+    used to get the prop type docs from top-level type definitions
+    like:
+
+        # This is the color type
+        Color = Optional(DesignToken(tokens.Color))
+
+    Since it's hard to statically determine if a top-level definition
+    is a HyperdivType, it includes all top-level definitions.
+
+    `class_attribute_docs` is a dict mapping class names to dicts that
+    map their attribute names to docs, collected from the component
+    and mixin files only.
+    """
+    return extract_docs_from_files(
+        get_source_files(), cache=cache, max_workers=max_workers
+    )
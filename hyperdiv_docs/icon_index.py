@@ -0,0 +1,138 @@
+"""
+A prebuilt search index over icon names, used by the icons reference
+page.
+
+Names are partitioned by family ("Outline", "Solid", "All Icons"). For
+each family, the index holds:
+
+* A sorted copy of the names, for prefix matches by binary search.
+* Posting lists mapping every 1, 2 and 3-character substring (n-gram)
+  of a name to the sorted positions of the names containing it.
+
+Substring queries intersect the postings of the query's trigrams (or
+its single bigram/unigram, for short queries), starting from the
+shortest posting list, and verify the few remaining candidates. Fuzzy
+queries match names containing the query's characters in order, and
+are narrowed down the same way using the query's unigrams.
+
+Results are arrays of positions, cached per query, and pages are
+sliced from them without building lists of names.
+"""
+
+import bisect
+from array import array
+from functools import lru_cache
+
+families = ("Outline", "Solid", "All Icons")
+
+
+def in_family(name, family):
+    if family == "Solid":
+        return "fill" in name
+    elif family == "Outline":
+        return "fill" not in name
+    return True
+
+
+def get_ngrams(s, n):
+    return {s[i : i + n] for i in range(len(s) - n + 1)}
+
+
+def is_subsequence(query, name):
+    it = iter(name)
+    return all(char in it for char in query)
+
+
+class IconSearchResult:
+    """
+    The result of a search. `len()` is the number of matches and
+    `page()` returns a page of matching names.
+    """
+
+    def __init__(self, names, positions=None, start=0, stop=None):
+        self.names = names
+        # Either an array of positions into `names`, or, if `None`, the
+        # contiguous range `names[start:stop]`.
+        self.positions = positions
+        self.start = start
+        self.stop = len(names) if stop is None else stop
+
+    def __len__(self):
+        if self.positions is not None:
+            return len(self.positions)
+        return self.stop - self.start
+
+    def page(self, page, per_page):
+        low = page * per_page
+        high = min(len(self), low + per_page)
+        if self.positions is not None:
+            return [self.names[i] for i in self.positions[low:high]]
+        return self.names[self.start + low : self.start + high]
+
+
+class IconFamilyIndex:
+    def __init__(self, names):
+        self.names = names
+        self.sorted_names = sorted(names)
+        self.postings = {}
+        for i, name in enumerate(names):
+            for n in (1, 2, 3):
+                for ngram in get_ngrams(name, n):
+                    self.postings.setdefault(ngram, array("I")).append(i)
+        self.all = IconSearchResult(names)
+
+    def candidates(self, ngrams):
+        postings = sorted(
+            (self.postings.get(ngram, array("I")) for ngram in ngrams), key=len
+        )
+        if not postings:
+            return range(len(self.names))
+        result = postings[0]
+        for posting in postings[1:]:
+            if not result:
+                break
+            other = set(posting)
+            result = [i for i in result if i in other]
+        return result
+
+    def substring(self, query):
+        n = min(len(query), 3)
+        candidates = self.candidates(get_ngrams(query, n))
+        if n < 3:
+            return IconSearchResult(self.names, array("I", candidates))
+        return IconSearchResult(
+            self.names,
+            array("I", [i for i in candidates if query in self.names[i]]),
+        )
+
+    def prefix(self, query):
+        start = bisect.bisect_left(self.sorted_names, query)
+        stop = bisect.bisect_left(self.sorted_names, query + "\U0010ffff")
+        return IconSearchResult(self.sorted_names, start=start, stop=stop)
+
+    def fuzzy(self, query):
+        candidates = self.candidates(set(query))
+        return IconSearchResult(
+            self.names,
+            array("I", [i for i in candidates if is_subsequence(query, self.names[i])]),
+        )
+
+
+class IconIndex:
+    def __init__(self, names):
+        self.families = {
+            family: IconFamilyIndex([name for name in names if in_family(name, family)])
+            for family in families
+        }
+
+    @lru_cache(maxsize=1024)
+    def search(self, query, family="All Icons", mode="substring"):
+        """
+        Returns an `IconSearchResult` of the names in `family` that
+        match `query`. `mode` is one of "substring", "prefix", or
+        "fuzzy".
+        """
+        family_index = self.families[family]
+        if not query:
+            return family_index.all
+        return getattr(family_index, mode)(query)
@@ -0,0 +1,413 @@
+"""
+A local load test of the docs app, for sizing deployments.
+
+This starts `start.py` in production mode on a loopback port, and
+opens simulated Hyperdiv websocket clients against it, ramping the
+number of concurrent clients through the given levels. Each client
+behaves like a reader:
+
+* It navigates to random pages of the sidebar `menu`.
+* It clicks the `Copy Link` button of a heading, when the page has one.
+* Now and then it visits the icons page, types a query into the icon
+  search box, and clicks the next-page button, unless it's disabled.
+
+For each level, this reports the event round-trip latency (the time
+from sending an event, or from opening the connection, to receiving
+the server's first message in response), the number of messages per
+second received from the server, and the server's resident memory
+(RSS).
+
+Run `python -m hyperdiv_docs.load_test --clients 1,10,50 --duration 20`.
+
+The clients speak the protocol of Hyperdiv's browser frontend, over
+Tornado's websocket client (Tornado is a Hyperdiv dependency):
+
+* The initial state of the `location`, `window`, `theme` and
+  `clipboard` singletons is passed as a JSON list of `[key, prop,
+  value]` updates in the `updates` query argument of the websocket
+  URL. The server renders the app once it connects.
+* Events are sent as JSON lists of messages, `[{"type": "update",
+  "updates": [[key, prop, value], ...]}]`, where `key` is a component
+  key.
+* The server sends JSON dicts whose `dom` and `diff` entries hold
+  rendered component nodes, which are dicts with `key`, `tag`, `props`
+  and `children` entries.
+
+Nodes are indexed from every message by walking its JSON, so the
+clients don't depend on the exact shape of DOM update messages. The
+keys of the `location` and `window` singletons can be overridden with
+`--location-key` and `--window-key`.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import signal
+import socket
+import asyncio
+import argparse
+import subprocess
+from urllib.parse import quote
+from .menu import menu
+
+default_client_levels = (1, 5, 10, 25, 50)
+
+# Seconds a client waits for the server to respond to an event before
+# counting it as timed out.
+response_timeout = 10
+
+# Seconds a client pauses between events, chosen uniformly.
+think_time = (0.2, 1.0)
+
+icons_path = "/reference/icons"
+
+icon_queries = ("arrow", "bell", "cal", "check", "fil", "heart", "sta", "x")
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    index = min(int(p / 100 * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def get_menu_paths():
+    return [info["href"] for links in menu.values() for info in links.values()]
+
+
+def get_rss_kb(pid):
+    """
+    The resident memory of process `pid` in kB, read from `/proc`, or
+    `None` where `/proc` is unavailable.
+    """
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+
+
+def wait_for_port(host, port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"The docs app didn't start on {host}:{port}.")
+
+
+def start_server(host, port):
+    """
+    Starts the docs app in a subprocess, and waits until it accepts
+    connections.
+    """
+    repo_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    start_script = os.path.join(repo_path, "start.py")
+    env = dict(os.environ, HD_HOST=host, HD_PORT=str(port), HD_PRODUCTION="1")
+    process = subprocess.Popen(
+        [sys.executable, start_script],
+        cwd=repo_path,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(host, port)
+    except Exception:
+        process.kill()
+        raise
+    return process
+
+
+def stop_server(process):
+    process.send_signal(signal.SIGINT)
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+class LevelStats:
+    def __init__(self):
+        self.latencies = []
+        self.messages = 0
+        self.timeouts = 0
+        self.errors = 0
+
+
+class SimulatedClient:
+    def __init__(self, url, stats, location_key, window_key, rng):
+        self.url = url
+        self.stats = stats
+        self.location_key = location_key
+        self.window_key = window_key
+        self.rng = rng
+        self.connection = None
+        self.reader = None
+        self.waiter = None
+        self.path = None
+        # key -> node, and key -> parent key, of every node seen.
+        self.nodes = {}
+        self.parents = {}
+
+    def index_nodes(self, value, parent_key=None):
+        if isinstance(value, dict):
+            key = value.get("key")
+            if key is not None and "tag" in value:
+                self.nodes[key] = value
+                self.parents[key] = parent_key
+                parent_key = key
+            for child in value.values():
+                self.index_nodes(child, parent_key)
+        elif isinstance(value, list):
+            for child in value:
+                self.index_nodes(child, parent_key)
+
+    def find_nodes(self, tag, **props):
+        return [
+            key
+            for key, node in self.nodes.items()
+            if node.get("tag") == tag
+            and all((node.get("props") or {}).get(p) == v for p, v in props.items())
+        ]
+
+    async def read_messages(self):
+        while True:
+            message = await self.connection.read_message()
+            if message is None:
+                return
+            self.stats.messages += 1
+            try:
+                self.index_nodes(json.loads(message))
+            except ValueError:
+                pass
+            if self.waiter and not self.waiter.done():
+                self.waiter.set_result(time.perf_counter())
+
+    async def wait_for_response(self, start):
+        try:
+            end = await asyncio.wait_for(self.waiter, response_timeout)
+            self.stats.latencies.append(end - start)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+
+    async def send(self, updates):
+        """
+        Sends an update event and records the time until the server's
+        first message in response.
+        """
+        self.waiter = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        await self.connection.write_message(
+            json.dumps([dict(type="update", updates=updates)])
+        )
+        await self.wait_for_response(start)
+
+    def get_initial_updates(self, path, host):
+        return [
+            [self.location_key, "protocol", "http:"],
+            [self.location_key, "host", host],
+            [self.location_key, "path", path],
+            [self.location_key, "query_args", ""],
+            [self.location_key, "hash_arg", ""],
+            [self.window_key, "width", 1440],
+            [self.window_key, "height", 900],
+            ["theme", "mode", "light"],
+            ["theme", "system_mode", "light"],
+            ["clipboard", "_value", ""],
+        ]
+
+    async def connect(self, path):
+        """
+        Opens the connection, and records the time until the server's
+        first render.
+        """
+        from tornado.websocket import websocket_connect
+
+        host = self.url.split("/")[2]
+        updates = json.dumps(self.get_initial_updates(path, host))
+        self.waiter = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        self.connection = await websocket_connect(
+            f"{self.url}?updates={quote(updates)}"
+        )
+        self.reader = asyncio.ensure_future(self.read_messages())
+        await self.wait_for_response(start)
+
+    async def navigate(self, path):
+        # Navigating to the current path gets no response, and keeps
+        # the current page.
+        if path == self.path:
+            return
+        self.path = path
+        self.nodes.clear()
+        self.parents.clear()
+        await self.send([[self.location_key, "path", path]])
+
+    async def click(self, key):
+        await self.send([[key, "clicked", True]])
+
+    async def copy_link(self):
+        keys = self.find_nodes("sl-icon-button", name="link")
+        if keys:
+            await self.click(self.rng.choice(keys))
+
+    async def search_icons(self):
+        await self.navigate(icons_path)
+        inputs = self.find_nodes("sl-input")
+        if inputs:
+            # The frontend debounces typing, so a typed query arrives as
+            # one update. Re-sending the current value would get no
+            # response, so a different query is picked.
+            value = self.nodes[inputs[-1]]["props"].get("value")
+            query = self.rng.choice([q for q in icon_queries if q != value])
+            await self.send(
+                [[inputs[-1], "value", query], [inputs[-1], "changed", True]]
+            )
+        for key in self.find_nodes("sl-icon", name="chevron-right"):
+            button = self.nodes.get(self.parents.get(key))
+            if button and not button["props"].get("disabled"):
+                await self.click(button["key"])
+
+    async def run(self, paths, stop_time):
+        self.path = self.rng.choice(paths)
+        await self.connect(self.path)
+        try:
+            while time.monotonic() < stop_time:
+                await asyncio.sleep(self.rng.uniform(*think_time))
+                if self.rng.random() < 0.15:
+                    await self.search_icons()
+                else:
+                    await self.navigate(
+                        self.rng.choice([p for p in paths if p != self.path])
+                    )
+                    await self.copy_link()
+        finally:
+            self.connection.close()
+            self.reader.cancel()
+
+
+async def run_level(url, num_clients, duration, location_key, window_key, seed):
+    stats = LevelStats()
+    paths = get_menu_paths()
+    stop_time = time.monotonic() + duration
+    clients = [
+        SimulatedClient(url, stats, location_key, window_key, random.Random(seed + i))
+        for i in range(num_clients)
+    ]
+    start = time.monotonic()
+    results = await asyncio.gather(
+        *(client.run(paths, stop_time) for client in clients),
+        return_exceptions=True,
+    )
+    elapsed = time.monotonic() - start
+    stats.errors = sum(1 for result in results if isinstance(result, Exception))
+    return stats, elapsed
+
+
+def summarize(num_clients, stats, elapsed, rss_kb):
+    latencies = sorted(stats.latencies)
+
+    def percentile_ms(p):
+        return percentile(latencies, p) * 1000 if latencies else None
+
+    return dict(
+        clients=num_clients,
+        events=len(latencies),
+        timeouts=stats.timeouts,
+        errors=stats.errors,
+        p50_ms=percentile_ms(50),
+        p95_ms=percentile_ms(95),
+        p99_ms=percentile_ms(99),
+        messages_per_second=stats.messages / elapsed if elapsed else 0,
+        rss_kb=rss_kb,
+    )
+
+
+def format_summary(summary):
+    def ms(value):
+        return f"{value:.1f}ms" if value else "-"
+
+    return (
+        f"{summary['clients']:>5} clients: "
+        f"p50={ms(summary['p50_ms'])} p95={ms(summary['p95_ms'])} "
+        f"p99={ms(summary['p99_ms'])} "
+        f"msgs/s={summary['messages_per_second']:.1f} "
+        f"rss={summary['rss_kb'] or '-'}kB "
+        f"timeouts={summary['timeouts']} errors={summary['errors']}"
+    )
+
+
+def run_load_test(
+    client_levels=default_client_levels,
+    duration=20,
+    host="127.0.0.1",
+    port=8899,
+    location_key="location",
+    window_key="window",
+    seed=0,
+    log=None,
+):
+    """
+    Starts the docs app, runs each level of concurrent clients for
+    `duration` seconds, stops the app, and returns a list of per-level
+    summaries.
+    """
+    process = start_server(host, port)
+    url = f"ws://{host}:{port}/ws"
+    summaries = []
+    try:
+        for num_clients in client_levels:
+            stats, elapsed = asyncio.run(
+                run_level(url, num_clients, duration, location_key, window_key, seed)
+            )
+            summary = summarize(num_clients, stats, elapsed, get_rss_kb(process.pid))
+            summaries.append(summary)
+            if log:
+                log(format_summary(summary))
+    finally:
+        stop_server(process)
+    return summaries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m hyperdiv_docs.load_test",
+        description="Load test the docs app with simulated websocket clients.",
+    )
+    parser.add_argument(
+        "--clients",
+        default=",".join(str(level) for level in default_client_levels),
+        help="Comma-separated numbers of concurrent clients to ramp through.",
+    )
+    parser.add_argument("--duration", type=float, default=20, help="Seconds per level.")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--location-key", default="location")
+    parser.add_argument("--window-key", default="window")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Write the summaries to this JSON file.")
+    args = parser.parse_args(argv)
+
+    summaries = run_load_test(
+        client_levels=[int(level) for level in args.clients.split(",")],
+        duration=args.duration,
+        port=args.port,
+        location_key=args.location_key,
+        window_key=args.window_key,
+        seed=args.seed,
+        log=print,
+    )
+
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(json.dumps(summaries, indent=2))
+
+
+if __name__ == "__main__":
+    main()
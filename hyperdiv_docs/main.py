@@ -2,6 +2,9 @@ from importlib.metadata import version
 import hyperdiv as hd
 from .router import router
 from .menu import menu
+from .routes import load_route, prewarm_routes
+from .search_box import search_box
+from .profiler import profile_route
 from .demos.app_template_demo import main as demo_main
 
 
@@ -32,6 +35,14 @@ def main():
         render_title()
     with app.drawer_title:
         render_title()
+    with app.topbar_links:
+        search_box()
     app.body.padding = 0
     with app.body:
-        router.run()
+        load_route(loc.path)
+        with profile_route(loc.path):
+            router.run()
+
+    # The app is serving, so import the remaining page modules in the
+    # background.
+    prewarm_routes()
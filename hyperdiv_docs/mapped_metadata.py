@@ -0,0 +1,241 @@
+"""
+A compact binary encoding of the docs metadata, designed to be
+`mmap`-ed read-only so that all the processes serving the docs app
+share the same physical pages, instead of each process holding its own
+parsed copy of the JSON metadata.
+
+`compile_metadata()` encodes a JSON-like value into a file, and
+`load_metadata()` maps the file and returns read-only `Mapping` and
+`Sequence` views that decode values lazily, on access. The views
+behave like the nested dicts and lists returned by `json.loads`, so
+code like `data["components"]["button"]["props"][0]["prop_name"]`
+works unchanged.
+
+File layout (all integers little-endian):
+
+    header: b"HDMD", u32 version, u32 root offset
+    values: a tag byte followed by the value's payload:
+      'N' None, 'T' True, 'F' False
+      'I' i64
+      'D' f64
+      'S' u32 byte length, utf-8 bytes
+      'L' u32 count, count * u32 item offsets
+      'M' u32 count, count * (u32 key offset, u32 value offset) in
+          insertion order, then count * u32 entry indices sorted by
+          key bytes, for binary search lookups.
+
+Strings, including dict keys, are stored once and shared by offset.
+"""
+
+import mmap
+import struct
+from collections.abc import Mapping, Sequence
+
+MAGIC = b"HDMD"
+VERSION = 1
+
+header_struct = struct.Struct("<4sII")
+u32 = struct.Struct("<I")
+i64 = struct.Struct("<q")
+f64 = struct.Struct("<d")
+
+
+class Compiler:
+    def __init__(self):
+        self.buf = bytearray(header_struct.size)
+        self.strings = {}
+
+    def tag(self, t):
+        offset = len(self.buf)
+        self.buf += t
+        return offset
+
+    def compile_str(self, s):
+        if s in self.strings:
+            return self.strings[s]
+        encoded = s.encode("utf-8")
+        offset = self.tag(b"S")
+        self.buf += u32.pack(len(encoded)) + encoded
+        self.strings[s] = offset
+        return offset
+
+    def compile(self, value):
+        if value is None:
+            return self.tag(b"N")
+        elif value is True:
+            return self.tag(b"T")
+        elif value is False:
+            return self.tag(b"F")
+        elif isinstance(value, int):
+            offset = self.tag(b"I")
+            self.buf += i64.pack(value)
+            return offset
+        elif isinstance(value, float):
+            offset = self.tag(b"D")
+            self.buf += f64.pack(value)
+            return offset
+        elif isinstance(value, str):
+            return self.compile_str(value)
+        elif isinstance(value, (list, tuple)):
+            item_offsets = [self.compile(item) for item in value]
+            offset = self.tag(b"L")
+            self.buf += u32.pack(len(item_offsets))
+            for item_offset in item_offsets:
+                self.buf += u32.pack(item_offset)
+            return offset
+        elif isinstance(value, dict):
+            keys = [str(k) for k in value.keys()]
+            entries = [
+                (self.compile_str(k), self.compile(v))
+                for k, v in zip(keys, value.values())
+            ]
+            sorted_indices = sorted(
+                range(len(keys)), key=lambda i: keys[i].encode("utf-8")
+            )
+            offset = self.tag(b"M")
+            self.buf += u32.pack(len(entries))
+            for key_offset, value_offset in entries:
+                self.buf += u32.pack(key_offset) + u32.pack(value_offset)
+            for i in sorted_indices:
+                self.buf += u32.pack(i)
+            return offset
+        raise TypeError(f"Cannot compile value of type {type(value).__name__}")
+
+
+def compile_metadata(data, path):
+    """
+    Encodes `data`, a JSON-like value, into the binary file at `path`.
+    """
+    compiler = Compiler()
+    root = compiler.compile(data)
+    compiler.buf[: header_struct.size] = header_struct.pack(MAGIC, VERSION, root)
+    with open(path, "wb") as f:
+        f.write(compiler.buf)
+
+
+def read_str_bytes(buf, offset):
+    (length,) = u32.unpack_from(buf, offset + 1)
+    start = offset + 1 + u32.size
+    return buf[start : start + length]
+
+
+def decode(buf, offset):
+    tag = buf[offset : offset + 1]
+    if tag == b"S":
+        return bytes(read_str_bytes(buf, offset)).decode("utf-8")
+    elif tag == b"M":
+        return MappedDict(buf, offset)
+    elif tag == b"L":
+        return MappedList(buf, offset)
+    elif tag == b"I":
+        return i64.unpack_from(buf, offset + 1)[0]
+    elif tag == b"D":
+        return f64.unpack_from(buf, offset + 1)[0]
+    elif tag == b"N":
+        return None
+    elif tag == b"T":
+        return True
+    elif tag == b"F":
+        return False
+    raise ValueError(f"Corrupt metadata at offset {offset}")
+
+
+class MappedList(Sequence):
+    """
+    A read-only, lazily-decoded view of an encoded list.
+    """
+
+    def __init__(self, buf, offset):
+        self.buf = buf
+        self.offset = offset
+        (self.count,) = u32.unpack_from(buf, offset + 1)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        (item_offset,) = u32.unpack_from(self.buf, self.offset + 5 + i * 4)
+        return decode(self.buf, item_offset)
+
+    def __eq__(self, other):
+        return isinstance(other, (list, MappedList)) and list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class MappedDict(Mapping):
+    """
+    A read-only, lazily-decoded view of an encoded dict. Iteration
+    follows the original insertion order, and key lookups are binary
+    searches over the encoded keys.
+    """
+
+    def __init__(self, buf, offset):
+        self.buf = buf
+        self.offset = offset
+        (self.count,) = u32.unpack_from(buf, offset + 1)
+        self.entries_offset = offset + 5
+        self.sorted_offset = self.entries_offset + self.count * 8
+
+    def entry(self, i):
+        return struct.unpack_from("<II", self.buf, self.entries_offset + i * 8)
+
+    def find(self, key):
+        if not isinstance(key, str):
+            return None
+        needle = key.encode("utf-8")
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            (i,) = u32.unpack_from(self.buf, self.sorted_offset + mid * 4)
+            key_offset, value_offset = self.entry(i)
+            candidate = read_str_bytes(self.buf, key_offset)
+            if candidate == needle:
+                return value_offset
+            elif candidate < needle:
+                low = mid + 1
+            else:
+                high = mid
+        return None
+
+    def __getitem__(self, key):
+        value_offset = self.find(key)
+        if value_offset is None:
+            raise KeyError(key)
+        return decode(self.buf, value_offset)
+
+    def __contains__(self, key):
+        return self.find(key) is not None
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for i in range(self.count):
+            key_offset, _ = self.entry(i)
+            yield decode(self.buf, key_offset)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def load_metadata(path):
+    """
+    Maps the binary metadata file at `path` read-only, and returns a
+    `MappedDict` view of its root.
+    """
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, root = header_struct.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a compatible docs metadata file")
+
+    return decode(buf, root)
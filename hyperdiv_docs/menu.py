@@ -1,70 +1,44 @@
-from .pages.introduction.overview import overview as introduction_overview
-from .pages.introduction.docs_overview import docs_overview
-
-from .pages.guide.getting_started import getting_started
-from .pages.guide.components import components as guide_components
-from .pages.guide.interactivity import interactivity
-from .pages.guide.component_props import component_props
-from .pages.guide.layout import layout
-from .pages.guide.conditional_rendering import conditional_rendering
-from .pages.guide.loops import loops
-from .pages.guide.state import state
-from .pages.guide.modular_apps import modular_apps
-from .pages.guide.tasks import tasks
-from .pages.guide.pages_and_navigation import pages_and_navigation
-from .pages.guide.using_the_app_template import using_the_app_template
-from .pages.guide.static_assets import static_assets
-from .pages.guide.deploying import deploying
-from .pages.guide.matplotlib_charts import matplotlib_charts
-
-from .pages.extending_hyperdiv.overview import overview as extending_overview
-from .pages.extending_hyperdiv.plugins import plugins
-from .pages.extending_hyperdiv.custom_assets import custom_assets
-from .pages.extending_hyperdiv.built_in_components import built_in_components
-from .pages.extending_hyperdiv.new_components import new_components
-
-from .pages.reference.components import components
-from .pages.reference.env_variables import env_variables
-from .pages.reference.design_tokens import design_tokens
-from .pages.reference.prop_types import prop_types
-from .pages.reference.icons import icons
-from .pages.reference.cli import cli
-
+# The sidebar navigation menu. Paths are declared directly, rather
+# than read off imported page functions, so that page modules can be
+# imported lazily. `routes.check_menu_routes` checks them against the
+# page modules' routes at startup.
 menu = {
     "Introduction": {
-        "Hyperdiv Overview": {"href": introduction_overview.path},
-        "This Documentation App": {"href": docs_overview.path},
+        "Hyperdiv Overview": {"href": "/introduction/overview"},
+        "This Documentation App": {"href": "/introduction/docs-overview"},
     },
     "Guide": {
-        "Getting Started": {"href": getting_started.path},
-        "Component Basics": {"href": guide_components.path},
-        "Interactivity Basics": {"href": interactivity.path},
-        "Component Props": {"href": component_props.path},
-        "Style & Layout": {"href": layout.path},
-        "Conditional Rendering": {"href": conditional_rendering.path},
-        "Rendering in Loops": {"href": loops.path},
-        "Custom State": {"href": state.path},
-        "Modular Apps": {"href": modular_apps.path},
-        "Asynchronous Tasks": {"href": tasks.path},
-        "Pages & Navigation": {"href": pages_and_navigation.path},
-        "Using The App Template": {"href": using_the_app_template.path},
-        "Matplotlib Charts": {"href": matplotlib_charts.path},
-        "Static Assets": {"href": static_assets.path},
-        "Deploying Hyperdiv": {"href": deploying.path},
+        "Getting Started": {"href": "/guide/getting-started"},
+        "Component Basics": {"href": "/guide/components"},
+        "Interactivity Basics": {"href": "/guide/interactivity"},
+        "Component Props": {"href": "/guide/props"},
+        "Style & Layout": {"href": "/guide/layout"},
+        "Conditional Rendering": {"href": "/guide/conditional-rendering"},
+        "Rendering in Loops": {"href": "/guide/loops"},
+        "Custom State": {"href": "/guide/state"},
+        "Modular Apps": {"href": "/guide/modular-apps"},
+        "Asynchronous Tasks": {"href": "/guide/tasks"},
+        "Pages & Navigation": {"href": "/guides/routing"},
+        "Using The App Template": {"href": "/guides/templates"},
+        "Matplotlib Charts": {"href": "/guide/matplotlib-charts"},
+        "Static Assets": {"href": "/guide/static-assets"},
+        "Deploying Hyperdiv": {"href": "/guide/deploying"},
     },
     "Extending Hyperdiv": {
-        "Overview": {"href": extending_overview.path},
-        "Building Plugins": {"href": plugins.path},
-        "Loading Custom Assets": {"href": custom_assets.path},
-        "Extending Built-In Components": {"href": built_in_components.path},
-        "Creating New Components": {"href": new_components.path},
+        "Overview": {"href": "/extending-hyperdiv"},
+        "Building Plugins": {"href": "/extending-hyperdiv/plugins"},
+        "Loading Custom Assets": {"href": "/extending-hyperdiv/custom-assets"},
+        "Extending Built-In Components": {
+            "href": "/extending-hyperdiv/built-in-components"
+        },
+        "Creating New Components": {"href": "/extending-hyperdiv/new-components"},
     },
     "Reference": {
-        "Hyperdiv API": {"href": components.path},
-        "Design Tokens": {"href": design_tokens.path},
-        "Prop Types": {"href": prop_types.path},
-        "Icons": {"href": icons.path},
-        "Environment Variables": {"href": env_variables.path},
-        "The Hyperdiv CLI": {"href": cli.path},
+        "Hyperdiv API": {"href": "/reference/components"},
+        "Design Tokens": {"href": "/reference/design-tokens"},
+        "Prop Types": {"href": "/reference/prop-types"},
+        "Icons": {"href": "/reference/icons"},
+        "Environment Variables": {"href": "/reference/env-variables"},
+        "The Hyperdiv CLI": {"href": "/reference/cli"},
     },
 }
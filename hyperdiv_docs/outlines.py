@@ -0,0 +1,138 @@
+"""
+Precomputed "On This Page" outlines.
+
+The outline of a page is its list of headings: the literal
+`p.heading()` calls of the page function, and the markdown headings
+(`##` to `######`) in the text of its `docs_markdown()` blocks. Both are
+collected statically from the page sources (see `page_sources.py`), so
+`page()` can render the outline of a page without re-deriving it on
+every render.
+
+The outlines of a page module's routes are built from its source once
+per process, when one of its pages is first rendered or by the
+background pre-warm (see `routes.py`). They are not persisted, so they
+always match the page sources being served.
+"""
+
+import re
+from collections import namedtuple
+from functools import cache
+from .doc_chunks import get_doc_chunks
+from .routes import route_modules, get_route_module
+
+# A heading, as rendered in the outline. `level` is the number of
+# leading `#`s and `anchor` is the hash link name of the heading.
+OutlineHeading = namedtuple("OutlineHeading", ["level", "title", "anchor"])
+
+# A section of markdown text, starting with the heading `heading`, or
+# with no heading (`None`) if the section precedes the first heading.
+TextSection = namedtuple("TextSection", ["heading", "text"])
+
+markdown_heading_pattern = re.compile(r"^(#{2,6})\s+\S")
+
+
+def make_anchor(s):
+    """Makes a hash link name from a heading name."""
+    return re.sub(r"[^a-zA-Z0-9]+", "-", s.lower()).lstrip("-")
+
+
+@cache
+def parse_heading(title):
+    """
+    Parses a markdown heading like `"## Heading"` into an
+    `OutlineHeading`.
+    """
+    level = 0
+    for i, char in enumerate(title):
+        if char == "#":
+            level += 1
+        else:
+            break
+
+    title = title[i:].strip()
+    return OutlineHeading(level, title, make_anchor(title))
+
+
+@cache
+def split_text_sections(text):
+    """
+    Splits the markdown `text` at its headings, into a tuple of
+    `TextSection`s. Lines inside fenced code blocks are never treated
+    as headings.
+    """
+    sections = []
+    heading = None
+    lines = []
+    inside_fence = False
+
+    for line in text.split("\n"):
+        if line.lstrip().startswith("```"):
+            inside_fence = not inside_fence
+        elif not inside_fence and markdown_heading_pattern.match(line):
+            if heading or "".join(lines).strip():
+                sections.append(TextSection(heading, "\n".join(lines)))
+            heading = parse_heading(line.strip())
+            lines = []
+        lines.append(line)
+
+    sections.append(TextSection(heading, "\n".join(lines)))
+    return tuple(sections)
+
+
+def get_blocks_outline(blocks):
+    """
+    Returns the tuple of `OutlineHeading`s in the given page blocks.
+    """
+    outline = []
+    for kind, text in blocks:
+        if kind == "heading":
+            outline.append(parse_heading(text.strip()))
+        elif kind == "docs_markdown":
+            for chunk in get_doc_chunks(text):
+                if chunk.type == "text":
+                    outline.extend(
+                        section.heading
+                        for section in split_text_sections(chunk.content)
+                        if section.heading
+                    )
+    return tuple(outline)
+
+
+@cache
+def get_module_outlines(module_name):
+    """
+    Returns a dict `path -> (OutlineHeading, ...)` for the concrete
+    routes of the given page module, built from its source.
+    """
+    from .page_sources import get_module_page_blocks
+
+    return {
+        path: get_blocks_outline(blocks)
+        for path, blocks in get_module_page_blocks(module_name).items()
+        if "{" not in path
+    }
+
+
+def get_page_outlines():
+    """
+    Returns a dict `path -> (OutlineHeading, ...)` for every concrete
+    route in the page modules.
+    """
+    outlines = {}
+    for module_name in route_modules:
+        outlines.update(get_module_outlines(module_name))
+    return outlines
+
+
+def get_page_outline(path):
+    """
+    Returns the precomputed outline of the page at `path`, or `None`
+    if the page's outline is not statically known, as for component
+    and prop type pages.
+    """
+    if path != "/":
+        path = path.rstrip("/")
+    module_name = get_route_module(path)
+    if module_name is None:
+        return None
+    return get_module_outlines(module_name).get(path)
@@ -1,12 +1,10 @@
-from functools import cache
-import re
+import bisect
+from functools import cache, wraps
+from collections import namedtuple
 import contextlib
 import hyperdiv as hd
-
-
-def make_anchor(s):
-    """Makes a hash link name from a heading name."""
-    return re.sub(r"[^a-zA-Z0-9]+", "-", s.lower())
+from .outlines import parse_heading, get_page_outline
+from .profiler import record_components
 
 
 class Heading:
@@ -16,15 +14,7 @@ class Heading:
     """
 
     def __init__(self, title):
-        self.level = 0
-        for i, char in enumerate(title):
-            if char == "#":
-                self.level += 1
-            else:
-                break
-
-        self.title = title[i:].strip()
-        self.anchor = make_anchor(self.title)
+        self.level, self.title, self.anchor = parse_heading(title)
 
         with hd.box():
             hd.anchor(self.anchor)
@@ -59,6 +49,67 @@ class HeadingsCollector:
         self.page_title = t
 
 
+# The window widths at which page layouts change, e.g. between the
+# narrow and wide layouts of `page()`. Static sections re-render only
+# when the window width crosses one of these bounds.
+width_bucket_bounds = (700, 1400)
+
+
+def get_width_bucket(width):
+    return bisect.bisect_right(width_bucket_bounds, width)
+
+
+def static_section(fn):
+    """
+    Decorates a function that renders a static subtree of a page,
+    like a long `docs_markdown()` block. It works like `hd.cached`:
+    the subtree is rendered on the first call, and reused on later
+    runs of the app, unless the subtree's own read dependencies (e.g. a
+    `Copy Link` button being clicked) change.
+
+    In addition, the subtree is cached separately per route, theme
+    mode, and window width bucket (see `width_bucket_bounds`), so it
+    re-renders when the theme mode changes or the window width crosses
+    a layout bound, but not on other changes to the window width.
+
+    For example:
+
+    ```py
+    with page() as p:
+        p.title("# Title")
+
+        @static_section
+        def content():
+            hd.markdown("...")
+
+        content()
+    ```
+
+    Headings rendered with `p.heading()` inside a static section are
+    collected only when the section runs, so pages with static
+    sections should rely on precomputed outlines (see `outlines.py`).
+    """
+    # `hd.cached` keys the cache by the function's name and its
+    # arguments, so the route, theme mode and width bucket are passed
+    # as leading arguments, and dropped before calling `fn`.
+    @hd.cached
+    @wraps(fn)
+    def cached_fn(path, is_dark, width_bucket, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        return cached_fn(
+            hd.location().path,
+            hd.theme().is_dark,
+            get_width_bucket(hd.window().width),
+            *args,
+            **kwargs,
+        )
+
+    return wrapper
+
+
 @contextlib.contextmanager
 def page():
     """
@@ -67,12 +118,17 @@ def page():
     collect headings, which are then used to render the "On This Page"
     section responsively.
 
-    It also automatically renders prev and next links at the bottom of
-    the content box.
+    If the current page's outline was precomputed (see `outlines.py`),
+    the "On This Page" section is rendered from it instead, which also
+    includes the headings inside the page's `docs_markdown()` text.
+
+    It also automatically renders a breadcrumb trail above the title,
+    and prev and next links at the bottom of the content box.
     """
     window = hd.window()
     wide = window.width > 1400
     headings_collector = HeadingsCollector()
+    outline = get_page_outline(hd.location().path)
 
     # Yield the collector in a delayed content box, to be rendered
     # later. During this phase, the caller can render any components
@@ -82,8 +138,13 @@ def page():
     with hd.box(collect=False, gap=2) as content_box:
         yield headings_collector
 
+    record_components(hd.location().path, content_box)
+
+    if outline is None:
+        outline = headings_collector.headings
+
     # Render the "On This Page" section, but do not collect it yet.
-    if len(headings_collector.headings) > 0:
+    if len(outline) > 0:
         with hd.box(
             background_color="neutral-50",
             border="1px solid neutral-100",
@@ -98,7 +159,7 @@ def page():
             hd.text("On This Page", font_weight="bold")
 
             with hd.box():
-                for h in headings_collector.headings:
+                for h in outline:
                     with hd.scope(h.anchor):
                         with hd.hbox(
                             gap=0.3,
@@ -111,26 +172,24 @@ def page():
                             ):
                                 hd.markdown(h.title)
 
-    if wide and len(headings_collector.headings) > 0:
+    if wide and len(outline) > 0:
         # When the window is wide, render a horizontal box with two
         # children, with the content box on the left, and the "On This
         # Page" box on the right.
         with hd.hbox(vertical_scroll=False):
             with hd.box(gap=2, padding=(4, 2, 2, 2), vertical_scroll=True):
-                if headings_collector.page_title:
-                    hd.markdown(headings_collector.page_title)
+                render_page_header(headings_collector.page_title)
                 content_box.collect()
                 render_prev_and_next_links()
             with hd.box(width=14, shrink=0, padding=(4, 2, 2, 0)):
                 on_this_page.collect()
     else:
         # When the window is narrow, render a single vertical box
-        # containing the title, followed by the "On This Page"
-        # section, followed by the content box.
+        # containing the breadcrumb and title, followed by the "On This
+        # Page" section, followed by the content box.
         with hd.box(gap=2, padding=(4, 2, 2, 2)):
-            if headings_collector.page_title:
-                hd.markdown(headings_collector.page_title)
-            if len(headings_collector.headings) > 0:
+            render_page_header(headings_collector.page_title)
+            if len(outline) > 0:
                 on_this_page.collect()
             content_box.collect()
             render_prev_and_next_links()
@@ -144,33 +203,170 @@ def get_flat_menu():
 
     for section, links in menu.items():
         for link_name, info in links.items():
-            flat_menu.append((section, link_name, info))
+            flat_menu.append((section, link_name, info["href"]))
 
     return flat_menu
 
 
-def get_prev_and_next_links():
+# An entry in the navigation index. `prev` and `next` are the hrefs of
+# the neighboring entries, or `None`. `breadcrumb` is a tuple of
+# `(title, href)` pairs, where `href` may be `None`.
+NavEntry = namedtuple("NavEntry", ["prev", "next", "section", "title", "breadcrumb"])
+
+
+def build_nav_index(links, make_breadcrumb):
     """
-    Compute the prev and next navigation links, relative to the
-    current location, from the navigation menu data structure.
+    Builds a dict `href -> NavEntry` from an ordered list of
+    `(section, title, href)` links, where each link's prev and next
+    entries are its neighbors in the list.
     """
-    flat_menu = get_flat_menu()
+    nav_index = {}
+    for i, (section, title, href) in enumerate(links):
+        nav_index[href] = NavEntry(
+            prev=links[i - 1][2] if i > 0 else None,
+            next=links[i + 1][2] if i < len(links) - 1 else None,
+            section=section,
+            title=title,
+            breadcrumb=make_breadcrumb(section, title, href),
+        )
+    return nav_index
 
-    loc = hd.location()
 
-    for i in range(len(flat_menu)):
-        _, _, info = flat_menu[i]
-        if info["href"] == loc.path:
-            if i == 0:
-                return (None, flat_menu[i + 1])
-            elif i == len(flat_menu) - 1:
-                return (flat_menu[i - 1], None)
-            else:
-                return (flat_menu[i - 1], flat_menu[i + 1])
+@cache
+def get_menu_nav_index():
+    """
+    The navigation index of the pages in the sidebar menu, in menu
+    order.
+    """
+    return build_nav_index(
+        get_flat_menu(),
+        lambda section, title, href: ((section, None), (title, href)),
+    )
+
+
+@cache
+def get_reference_nav_index():
+    """
+    The navigation index of the component and prop type pages, which
+    are not in the sidebar menu. Components are ordered by their
+    category on the Hyperdiv API page, followed by the remaining
+    components (e.g. mixins) in alphabetical order. Prop types are
+    ordered as on the Prop Types page.
+    """
+    from .docs_metadata import get_docs_metadata_index
+    from .pages.reference.components import (
+        core_api,
+        non_ui_components,
+        ui_components,
+    )
+
+    index = get_docs_metadata_index()
+
+    component_links = [
+        (category, name, f"/reference/components/{name}")
+        for categories in (core_api, non_ui_components, ui_components)
+        for category, names in categories.items()
+        for name in names
+        if name in index["components"]
+    ]
+    listed = set(href for _, _, href in component_links)
+    component_links += [
+        ("Other", name, f"/reference/components/{name}")
+        for name in sorted(index["components"])
+        if f"/reference/components/{name}" not in listed
+    ]
+
+    prop_types = sorted(index["prop_types"].values(), key=lambda pt: not pt["toplevel"])
+    prop_type_links = [
+        (
+            "User-Facing State Types" if pt["toplevel"] else "Other Types",
+            pt["name"],
+            f"/reference/prop-types/{pt['name']}",
+        )
+        for pt in prop_types
+    ]
+
+    nav_index = build_nav_index(
+        component_links,
+        lambda section, title, href: (
+            ("Reference", None),
+            ("Hyperdiv API", "/reference/components"),
+            (section, None),
+            (title, href),
+        ),
+    )
+    nav_index.update(
+        build_nav_index(
+            prop_type_links,
+            lambda section, title, href: (
+                ("Reference", None),
+                ("Prop Types", "/reference/prop-types"),
+                (title, href),
+            ),
+        )
+    )
+    return nav_index
+
+
+def get_nav_entry(path):
+    """
+    Returns the `NavEntry` of `path`, or `None` if the path is not
+    navigable.
+    """
+    if path != "/":
+        path = path.rstrip("/")
+
+    nav_entry = get_menu_nav_index().get(path)
+    if nav_entry:
+        return nav_entry
+
+    if path.startswith("/reference/components/") or path.startswith(
+        "/reference/prop-types/"
+    ):
+        return get_reference_nav_index().get(path)
+
+
+def get_nav_link(href):
+    """
+    Returns the `(section, title, href)` link of the navigation entry
+    at `href`, or `None` if `href` is `None`.
+    """
+    if href is None:
+        return None
+    nav_entry = get_nav_entry(href)
+    return nav_entry.section, nav_entry.title, href
+
+
+def get_prev_and_next_links():
+    """
+    Look up the prev and next navigation links of the current
+    location in the navigation index.
+    """
+    nav_entry = get_nav_entry(hd.location().path)
+
+    if nav_entry:
+        return get_nav_link(nav_entry.prev), get_nav_link(nav_entry.next)
 
     return None, None
 
 
+def render_page_header(page_title):
+    """
+    Renders the breadcrumb trail of the current location, looked up in
+    the navigation index, followed by the page title, if any.
+    """
+    nav_entry = get_nav_entry(hd.location().path)
+
+    if nav_entry:
+        with hd.breadcrumb(font_size="small"):
+            for i, (title, href) in enumerate(nav_entry.breadcrumb):
+                with hd.scope(i):
+                    hd.breadcrumb_item(title, href=href)
+
+    if page_title:
+        hd.markdown(page_title)
+
+
 def link_box(section, title, href, prev=True):
     """
     Render a prev or a next link box. If `prev` is `True` it renders a
@@ -215,8 +411,8 @@ def render_prev_and_next_links():
     if prev_link or next_link:
         with hd.hbox(gap=1, padding=(2, 0, 2, 0)):
             if prev_link:
-                (section, title, info) = prev_link
-                link_box(section, title, info["href"])
+                (section, title, href) = prev_link
+                link_box(section, title, href)
             if next_link:
-                (section, title, info) = next_link
-                link_box(section, title, info["href"], prev=False)
+                (section, title, href) = next_link
+                link_box(section, title, href, prev=False)
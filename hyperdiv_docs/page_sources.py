@@ -0,0 +1,136 @@
+"""
+Static extraction of page content from the page modules' source.
+
+For each function decorated with `@router.route(path)`, this collects
+the literal strings passed to the page's content-rendering calls, in
+source order, without importing or running the page:
+
+    p.title("# Title")          -> PageBlock("title", "# Title")
+    p.heading("## Heading")     -> PageBlock("heading", "## Heading")
+    hd.markdown("...")          -> PageBlock("markdown", "...")
+    docs_markdown("...")        -> PageBlock("docs_markdown", "...")
+    hd.code("...")              -> PageBlock("code", "...")
+    code_example("...")         -> PageBlock("code", "...")
+
+`docs_markdown` blocks may contain code examples, delimited as
+described in `code_examples.py`.
+
+Content rendered from non-literal values, like f-strings or docs
+metadata, is not collected.
+"""
+
+import os
+import ast
+from collections import namedtuple
+from functools import cache
+from textwrap import dedent as dedent_text
+from .routes import route_modules
+
+PageBlock = namedtuple("PageBlock", ["kind", "text"])
+
+# call name -> block kind
+block_calls = {
+    "title": "title",
+    "heading": "heading",
+    "markdown": "markdown",
+    "docs_markdown": "docs_markdown",
+    "code": "code",
+    "code_example": "code",
+}
+
+
+def get_page_module_path(module_name):
+    return (
+        os.path.join(os.path.dirname(__file__), "pages", *module_name.split("."))
+        + ".py"
+    )
+
+
+def parse_page_module(module_name):
+    with open(get_page_module_path(module_name), encoding="utf-8") as f:
+        return ast.parse(f.read())
+
+
+def get_call_name(node):
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    elif isinstance(node.func, ast.Attribute):
+        return node.func.attr
+
+
+def get_route_args(function_node):
+    """
+    Returns `(path, redirect_from)` from the `@router.route(path,
+    redirect_from=(...))` decorator of a page function node, or `None`
+    if the function is not a route.
+    """
+    for decorator in function_node.decorator_list:
+        if (
+            isinstance(decorator, ast.Call)
+            and get_call_name(decorator) == "route"
+            and decorator.args
+            and isinstance(decorator.args[0], ast.Constant)
+        ):
+            redirect_from = ()
+            for keyword in decorator.keywords:
+                if keyword.arg == "redirect_from":
+                    redirect_from = tuple(ast.literal_eval(keyword.value))
+            return decorator.args[0].value, redirect_from
+
+
+def get_module_routes(module_name):
+    """
+    Returns a list of `(path, redirect_from)` for the routes defined
+    at the top level of the given page module.
+    """
+    routes = []
+    for node in parse_page_module(module_name).body:
+        if isinstance(node, ast.FunctionDef):
+            route_args = get_route_args(node)
+            if route_args:
+                routes.append(route_args)
+    return routes
+
+
+def extract_blocks(function_node):
+    calls = [
+        node
+        for node in ast.walk(function_node)
+        if isinstance(node, ast.Call)
+        and get_call_name(node) in block_calls
+        and node.args
+        and isinstance(node.args[0], ast.Constant)
+        and isinstance(node.args[0].value, str)
+    ]
+    calls.sort(key=lambda node: (node.lineno, node.col_offset))
+    return tuple(
+        PageBlock(block_calls[get_call_name(node)], dedent_text(node.args[0].value))
+        for node in calls
+    )
+
+
+@cache
+def get_module_page_blocks(module_name):
+    """
+    Returns a dict `path -> (PageBlock, ...)` for the routes defined at
+    the top level of the given page module, e.g. "guide.tasks".
+    """
+    pages = {}
+    for node in parse_page_module(module_name).body:
+        if isinstance(node, ast.FunctionDef):
+            route_args = get_route_args(node)
+            if route_args:
+                pages[route_args[0]] = extract_blocks(node)
+    return pages
+
+
+@cache
+def get_page_blocks():
+    """
+    Returns a dict `path -> (PageBlock, ...)` for all the routes of all
+    the page modules in `routes.route_modules`.
+    """
+    pages = {}
+    for module_name in route_modules:
+        pages.update(get_module_page_blocks(module_name))
+    return pages
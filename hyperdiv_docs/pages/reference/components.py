@@ -3,84 +3,129 @@ from ...router import router
 from ...code_examples import docs_markdown
 from ...utils import render_value
 from ...page import page
-from ...docs_metadata import get_docs_metadata
+from ...docs_metadata import get_component_metadata
+from ...windowed_list import windowed_list, ChainedSequence
 
+# The number of props and methods rendered initially on a component
+# page, and added by each "Show More" click.
+items_page_size = 15
 
-def render_methods(methods):
+
+def render_methods(methods, inherited_methods=(), key=None):
     hd.markdown("### Methods")
 
-    with hd.box(gap=1):
-        for method in methods:
-            with hd.scope(method["sig"]):
-                with hd.box(
-                    border="1px solid neutral-100",
-                    border_radius="large",
-                ):
-                    with hd.box(
-                        background_color="neutral-50",
-                        border_radius=("large", "large", 0, 0),
-                    ):
-                        hd.code(method["sig"], grow=1)
-                    if method.get("overrides"):
-                        with hd.box(padding=(0.6, 1, 0.6, 1)):
-                            hd.markdown(
-                                f"Overrides `{method['method_name']}` from "
-                                f"[`{method['overrides']}`](/reference/components/{method['overrides']}/).",
-                            )
-                    if method["doc"]:
-                        with hd.box(padding=(0.6, 1, 0.6, 1)):
-                            docs_markdown(method["doc"])
-
-
-def render_props(props):
+    if inherited_methods:
+        hd.markdown(
+            "Inherited: "
+            + ", ".join(
+                f"[`{m['method_name']}`](/reference/components/{m['defined_in']}/)"
+                for m in inherited_methods
+            )
+        )
+
+    with hd.scope("methods"):
+        windowed_list(methods, render_method, page_size=items_page_size, key=key)
+
+
+def render_method(method):
+    with hd.scope(method["sig"]):
+        with hd.box(
+            border="1px solid neutral-100",
+            border_radius="large",
+        ):
+            with hd.box(
+                background_color="neutral-50",
+                border_radius=("large", "large", 0, 0),
+            ):
+                hd.code(method["sig"], grow=1)
+            if method.get("overrides"):
+                with hd.box(padding=(0.6, 1, 0.6, 1)):
+                    hd.markdown(
+                        f"Overrides `{method['method_name']}` from "
+                        f"[`{method['overrides']}`](/reference/components/{method['overrides']}/).",
+                    )
+            if method["doc"]:
+                with hd.box(padding=(0.6, 1, 0.6, 1)):
+                    docs_markdown(method["doc"])
+
+
+def render_props(props, inherited_props=(), key=None):
+    """
+    Renders the component's own `props`, followed by the
+    `inherited_props`, each of which is a `dict(defined_in, entry)`.
+    """
     hd.markdown("### Props")
-    with hd.box(gap=1):
-        for prop in props:
-            with hd.scope(prop["prop_name"]):
-                with hd.box(gap=0.2, border="1px solid neutral-100", border_radius=0.4):
-                    default_value = render_value(prop["default_value"])
-                    with hd.hbox(
-                        gap=0.5,
-                        background_color="neutral-50",
-                        justify="space-between",
-                        border_radius=(0.3, 0.3, 0, 0),
-                        padding=(0.5, 1, 0.5, 1),
-                        align="center",
-                    ):
-                        hd.text(
-                            f"{prop['prop_name']} = {default_value}", font_family="mono"
-                        )
-                        if prop["immutable"]:
-                            hd.badge(
-                                "read-only",
-                                variant="neutral",
-                                padding=(0, 0.3, 0, 0.3),
-                                height=1.2,
-                            )
-
-                    with hd.box():
-                        hd.markdown(
-                            f"type: {prop['markdown']}",
-                            font_family="mono",
-                            padding=(0.5, 1, 0.5, 1),
+    with hd.scope("props"):
+        windowed_list(
+            ChainedSequence(props, inherited_props),
+            render_prop_item,
+            page_size=items_page_size,
+            key=key,
+        )
+
+
+def render_prop_item(item):
+    if "defined_in" in item:
+        render_prop(item["entry"], item["defined_in"])
+    else:
+        render_prop(item)
+
+
+def render_prop(prop, defined_in=None):
+    with hd.scope(prop["prop_name"]):
+        with hd.box(gap=0.2, border="1px solid neutral-100", border_radius=0.4):
+            default_value = render_value(prop["default_value"])
+            with hd.hbox(
+                gap=0.5,
+                background_color="neutral-50",
+                justify="space-between",
+                border_radius=(0.3, 0.3, 0, 0),
+                padding=(0.5, 1, 0.5, 1),
+                align="center",
+            ):
+                hd.text(f"{prop['prop_name']} = {default_value}", font_family="mono")
+                with hd.hbox(gap=0.5, align="center"):
+                    if defined_in:
+                        href = f"/reference/components/{defined_in}"
+                        hd.markdown(f"from [`{defined_in}`]({href})", font_size="small")
+                    if prop["immutable"]:
+                        hd.badge(
+                            "read-only",
+                            variant="neutral",
+                            padding=(0, 0.3, 0, 0.3),
+                            height=1.2,
                         )
-                        prop_doc = prop["prop_doc"]
-                        if prop_doc:
-                            hd.divider(color="neutral-100")
-                            with hd.box(padding=(0.5, 1, 0.5, 1)):
-                                docs_markdown(prop_doc)
+
+            with hd.box():
+                hd.markdown(
+                    f"type: {prop['markdown']}",
+                    font_family="mono",
+                    padding=(0.5, 1, 0.5, 1),
+                )
+                prop_doc = prop["prop_doc"]
+                if prop_doc:
+                    hd.divider(color="neutral-100")
+                    with hd.box(padding=(0.5, 1, 0.5, 1)):
+                        docs_markdown(prop_doc)
 
 
-def render_slots(slots):
+def render_slots(slots, inherited_slots=()):
     # TODO: Nicer rendering of slots
     hd.markdown("### Slots")
-    hd.markdown(", ".join([f"`{slot['slot_name']}`" for slot in slots]))
+    hd.markdown(
+        ", ".join(
+            [f"`{slot['slot_name']}`" for slot in slots]
+            + [
+                f"`{slot['entry']['slot_name']}` (from `{slot['defined_in']}`)"
+                for slot in inherited_slots
+            ]
+        )
+    )
 
 
 @router.route("/reference/components/{component_name}")
 def reference_component(component_name):
-    data = get_docs_metadata()
-    component = data["components"].get(component_name)
+    component = get_component_metadata(component_name)
     if not component:
         router.render_not_found()
         return
@@ -124,12 +169,28 @@ def reference_component(component_name):
                 docs_markdown(component["doc"])
 
             if component["component_type"] == "class":
-                if component["props"]:
-                    render_props(component["props"])
-                if component["slots"]:
-                    render_slots(component["slots"])
-                if component["methods"]:
-                    render_methods(component["methods"])
+                # The inherited props and slots are precomputed in the
+                # component's metadata, so showing them costs no
+                # further lookups.
+                inherited = component.get("inherited") or {}
+                inherited_props = []
+                inherited_slots = []
+                if inherited.get("props") or inherited.get("slots"):
+                    if hd.switch("Show inherited props and slots").checked:
+                        inherited_props = inherited["props"]
+                        inherited_slots = inherited["slots"]
+
+                if component["props"] or inherited_props:
+                    render_props(
+                        component["props"], inherited_props, key=component_name
+                    )
+                if component["slots"] or inherited_slots:
+                    render_slots(component["slots"], inherited_slots)
+                inherited_methods = component.get("inherited_methods", [])
+                if component["methods"] or inherited_methods:
+                    render_methods(
+                        component["methods"], inherited_methods, key=component_name
+                    )
 
 
 core_api = {
@@ -1,8 +1,24 @@
+from functools import cache
 import hyperdiv as hd
 from hyperdiv.icons import icon_names as hyperdiv_icon_names
 from ...router import router
 from ...page import page
 from ...code_examples import docs_markdown
+from ...icon_index import IconIndex
+
+match_modes = {
+    "Contains": "substring",
+    "Starts With": "prefix",
+    "Fuzzy": "fuzzy",
+}
+
+
+@cache
+def get_icon_index():
+    """
+    The process-wide icon search index, built on first use.
+    """
+    return IconIndex(hyperdiv_icon_names)
 
 
 @router.route("/reference/icons")
@@ -27,7 +43,10 @@ def icons():
             the icon to copy its name to the clipboard.
 
             Use the search box to narrow to the list of icons whose names
-            match the search text.
+            match the search text. "Contains" matches names containing
+            the text, "Starts With" matches names starting with the
+            text, and "Fuzzy" matches names containing the text's
+            characters in order.
             """
         )
 
@@ -42,32 +61,23 @@ def icons():
                 value="Outline",
                 grow=1,
             )
+            match_mode = hd.select(
+                options=tuple(match_modes),
+                value="Contains",
+                grow=1,
+            )
 
-        if search_box.changed:
-            s.page = 0
-
-        if icon_family.changed:
+        if search_box.changed or icon_family.changed or match_mode.changed:
             s.page = 0
 
-        icon_names = [
-            icon_name
-            for icon_name in hyperdiv_icon_names
-            if search_box.value in icon_name
-            and (
-                "fill" in icon_name
-                if icon_family.value == "Solid"
-                else "fill" not in icon_name
-                if icon_family.value == "Outline"
-                else True
-            )
-        ]
+        icon_names = get_icon_index().search(
+            search_box.value, icon_family.value, match_modes[match_mode.value]
+        )
 
         num_pages = (len(icon_names) / per_page) - 1
-        low = s.page * per_page
-        high = min(len(icon_names), (s.page + 1) * per_page)
 
         with hd.hbox(wrap="wrap"):
-            for icon_name in icon_names[low:high]:
+            for icon_name in icon_names.page(s.page, per_page):
                 with hd.scope(icon_name):
                     with hd.tooltip(icon_name) as tooltip:
                         if hd.icon_button(
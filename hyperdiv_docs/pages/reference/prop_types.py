@@ -2,17 +2,31 @@ import hyperdiv as hd
 from ...router import router
 from ...code_examples import docs_markdown
 from ...page import page
-from ...docs_metadata import get_docs_metadata
+from ...docs_metadata import get_docs_metadata_index, get_prop_type_metadata
+from ...windowed_list import windowed_list
+
+# The number of prop type links rendered initially in each list of the
+# prop types index, and added by each "Show More" click.
+links_page_size = 50
+
+
+def render_prop_type_link(pt):
+    with hd.scope(pt["name"]):
+        hd.link(
+            pt["name"],
+            href=f"/reference/prop-types/{pt['name']}",
+            width="fit-content",
+        )
 
 
 @router.route("/reference/prop-types")
 def prop_types():
-    data = get_docs_metadata()
+    index = get_docs_metadata_index()
 
     top_level_types = []
     concrete_types = []
 
-    for pt in data["prop_types"].values():
+    for pt in index["prop_types"].values():
         if pt["toplevel"]:
             top_level_types.append(pt)
         else:
@@ -54,14 +68,13 @@ def prop_types():
             """
         )
 
-        with hd.box(gap=0.5):
-            for pt in top_level_types:
-                with hd.scope(pt["name"]):
-                    hd.link(
-                        pt["name"],
-                        href=f"/reference/prop-types/{pt['name']}",
-                        width="fit-content",
-                    )
+        with hd.scope("top_level_types"):
+            windowed_list(
+                top_level_types,
+                render_prop_type_link,
+                page_size=links_page_size,
+                gap=0.5,
+            )
 
         p.heading("## Other Types")
 
@@ -72,14 +85,13 @@ def prop_types():
             """
         )
 
-        with hd.box(gap=0.5):
-            for pt in concrete_types:
-                with hd.scope(pt["name"]):
-                    hd.link(
-                        pt["name"],
-                        href=f"/reference/prop-types/{pt['name']}",
-                        width="fit-content",
-                    )
+        with hd.scope("concrete_types"):
+            windowed_list(
+                concrete_types,
+                render_prop_type_link,
+                page_size=links_page_size,
+                gap=0.5,
+            )
 
 
 @router.route("/reference/prop-types/{prop_type}")
@@ -97,13 +109,11 @@ def prop_type(prop_type_name):
             )
         return
 
-    data = get_docs_metadata()
-    if prop_type_name not in data["prop_types"]:
+    prop_type = get_prop_type_metadata(prop_type_name)
+    if not prop_type:
         router.render_not_found()
         return
 
-    prop_type = data["prop_types"][prop_type_name]
-
     with page() as p:
         p.title(f"# `{prop_type_name}`")
 
@@ -0,0 +1,261 @@
+"""
+Render-time profiling of the docs app.
+
+When enabled, by setting the `HD_DOCS_PROFILE` environment variable to
+`"1"` or `"true"`, this records:
+
+* The wall time of each route render, around `router.run()`.
+* The number of components rendered in each page's content box, in
+  `page()`.
+* The wall time spent in `docs_markdown()`, in executing live code
+  examples, and in `get_docs_metadata()`.
+
+Observations are kept in in-process histograms, labeled by route
+template (e.g. "/reference/components/{component_name}") or by
+section, and are served in the Prometheus text format at
+`http://127.0.0.1:<port>/_metrics` by `start_metrics_server()`. The
+port is `HD_DOCS_METRICS_PORT`, defaulting to 8889. When several worker
+processes run the app, only the first to bind the port serves metrics;
+setting the port to 0 makes each worker bind a free port, which it logs.
+
+When disabled, which is the default, `profiled()` returns functions
+unchanged, and the context managers below are a shared no-op context.
+"""
+
+import os
+import time
+import logging
+import bisect
+import threading
+import contextlib
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+
+def profiling_enabled():
+    return os.environ.get("HD_DOCS_PROFILE", "").lower() in ("1", "true")
+
+
+# Read once, so that disabled profiling costs a single global lookup.
+enabled = profiling_enabled()
+
+metrics_host = "127.0.0.1"
+default_metrics_port = 8889
+
+# Histogram bucket upper bounds.
+seconds_buckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+count_buckets = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# metric name -> (help text, bucket bounds, label name)
+metric_definitions = {
+    "hd_docs_route_render_seconds": (
+        "Wall time of rendering a route.",
+        seconds_buckets,
+        "route",
+    ),
+    "hd_docs_route_components": (
+        "Number of components rendered in a page's content.",
+        count_buckets,
+        "route",
+    ),
+    "hd_docs_section_seconds": (
+        "Wall time spent in docs_markdown, code example execution, and "
+        "get_docs_metadata.",
+        seconds_buckets,
+        "section",
+    ),
+}
+
+# A reusable context manager that does nothing.
+null_context = contextlib.nullcontext()
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # One count per bucket, plus one for values above the last
+        # bound. Not cumulative.
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+# (metric name, label value) -> Histogram
+histograms = {}
+histograms_lock = threading.Lock()
+
+metrics_server = None
+
+
+def observe(metric, label_value, value):
+    with histograms_lock:
+        histogram = histograms.get((metric, label_value))
+        if histogram is None:
+            histogram = Histogram(metric_definitions[metric][1])
+            histograms[(metric, label_value)] = histogram
+        histogram.observe(value)
+
+
+@contextlib.contextmanager
+def timed(metric, label_value):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(metric, label_value, time.perf_counter() - start)
+
+
+def get_route_label(path):
+    from .routes import get_route_template
+
+    return get_route_template(path) or "not_found"
+
+
+def profile_route(path):
+    """
+    A context manager that records the render time of the route
+    serving `path`.
+    """
+    if not enabled:
+        return null_context
+    return timed("hd_docs_route_render_seconds", get_route_label(path))
+
+
+def profile_section(section):
+    """
+    A context manager that records the time spent in `section`.
+    """
+    if not enabled:
+        return null_context
+    return timed("hd_docs_section_seconds", section)
+
+
+def profiled(section):
+    """
+    A decorator that records the time spent in the decorated function
+    under `section`. Returns the function unchanged when profiling is
+    disabled.
+    """
+
+    def decorator(fn):
+        if not enabled:
+            return fn
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed("hd_docs_section_seconds", section):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count_components(component):
+    # `children` raises on components that can't have children.
+    if not getattr(component, "_has_children", False):
+        return 1
+    return 1 + sum(count_components(child) for child in component.children)
+
+
+def record_components(path, root):
+    """
+    Records the number of components in the tree rooted at `root`,
+    rendered by the route serving `path`.
+    """
+    if enabled:
+        observe(
+            "hd_docs_route_components",
+            get_route_label(path),
+            count_components(root),
+        )
+
+
+def escape_label_value(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_bound(bound):
+    return repr(float(bound))
+
+
+def render_metrics():
+    """
+    Renders the recorded histograms in the Prometheus text format.
+    """
+    with histograms_lock:
+        snapshot = {
+            key: (list(h.counts), h.sum, h.count) for key, h in histograms.items()
+        }
+
+    lines = []
+    for metric, (help_text, buckets, label_name) in metric_definitions.items():
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} histogram")
+        for (name, label_value), (counts, total, count) in sorted(snapshot.items()):
+            if name != metric:
+                continue
+            label = f'{label_name}="{escape_label_value(label_value)}"'
+            cumulative = 0
+            for bound, bucket_count in zip(buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{format_bound(bound)}"'
+                lines.append(f"{metric}_bucket{{{label},{le}}} {cumulative}")
+            lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {count}')
+            lines.append(f"{metric}_sum{{{label}}} {total}")
+            lines.append(f"{metric}_count{{{label}}} {count}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/_metrics":
+            self.send_error(404)
+            return
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server():
+    """
+    Starts serving `/_metrics` on the loopback interface, in a
+    background thread. Does nothing if profiling is disabled. Only the
+    first call has an effect.
+
+    If the port can't be bound, e.g. because another worker process
+    already serves metrics on it, logs a warning and serves nothing.
+    """
+    global metrics_server
+
+    if metrics_server or not enabled:
+        return
+
+    port = int(os.environ.get("HD_DOCS_METRICS_PORT", default_metrics_port))
+    try:
+        metrics_server = ThreadingHTTPServer((metrics_host, port), MetricsHandler)
+    except OSError as e:
+        logger.warning(
+            f"Not serving metrics in process {os.getpid()}: "
+            f"cannot bind {metrics_host}:{port}: {e}"
+        )
+        return
+
+    logger.info(
+        f"Serving metrics at http://{metrics_host}:"
+        f"{metrics_server.server_port}/_metrics"
+    )
+    threading.Thread(target=metrics_server.serve_forever, daemon=True).start()
@@ -1,7 +1,27 @@
 import hyperdiv as hd
 from .page import page
 
-router = hd.router()
+
+class DocsRouter(hd.router):
+    """
+    A router whose route tables are copied on write. Page modules are
+    imported, registering their routes, in the background while other
+    sessions run the router (see `routes.py`), so registering a route
+    replaces the tables instead of mutating them while `run()` may be
+    iterating over them.
+    """
+
+    def _add_route(self, path, fn, redirect_from=None):
+        routes = dict(self.routes)
+        routes[path] = fn
+        redirects = dict(self.redirects)
+        for redirect in redirect_from or ():
+            redirects[redirect] = path
+        self.routes = routes
+        self.redirects = redirects
+
+
+router = DocsRouter()
 
 
 @router.not_found
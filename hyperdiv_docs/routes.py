@@ -0,0 +1,192 @@
+"""
+A lazy registry of the docs app's routes.
+
+Each page module is declared here with the paths it serves. A module
+is only imported, which registers its routes on `router`, when one of
+its paths is first navigated to. `prewarm_routes()` imports the
+remaining page modules, and warms the docs caches, in a background
+thread once the app is serving.
+
+The table is static so that startup does no work per page module.
+`tests/test_routes.py` checks it against the modules' `@router.route`
+decorators.
+"""
+
+import os
+import re
+import threading
+import importlib
+
+# page module -> the paths it serves, including paths it redirects
+# from, in the order in which the modules are pre-warmed. `{name}`
+# segments match any single path segment.
+route_modules = {
+    "introduction.overview": ("/introduction/overview", "/", "/introduction"),
+    "introduction.docs_overview": ("/introduction/docs-overview",),
+    "guide.getting_started": ("/guide/getting-started", "/guide"),
+    "guide.components": ("/guide/components",),
+    "guide.interactivity": ("/guide/interactivity",),
+    "guide.component_props": ("/guide/props",),
+    "guide.layout": ("/guide/layout",),
+    "guide.conditional_rendering": ("/guide/conditional-rendering",),
+    "guide.loops": ("/guide/loops",),
+    "guide.state": ("/guide/state",),
+    "guide.modular_apps": ("/guide/modular-apps",),
+    "guide.tasks": ("/guide/tasks",),
+    "guide.pages_and_navigation": ("/guides/routing",),
+    "guide.using_the_app_template": ("/guides/templates",),
+    "guide.matplotlib_charts": ("/guide/matplotlib-charts",),
+    "guide.static_assets": ("/guide/static-assets",),
+    "guide.deploying": ("/guide/deploying",),
+    "extending_hyperdiv.overview": ("/extending-hyperdiv",),
+    "extending_hyperdiv.plugins": ("/extending-hyperdiv/plugins",),
+    "extending_hyperdiv.custom_assets": ("/extending-hyperdiv/custom-assets",),
+    "extending_hyperdiv.built_in_components": (
+        "/extending-hyperdiv/built-in-components",
+    ),
+    "extending_hyperdiv.new_components": ("/extending-hyperdiv/new-components",),
+    "reference.components": (
+        "/reference/components/{component_name}",
+        "/reference/components",
+    ),
+    "reference.design_tokens": (
+        "/reference/design-tokens",
+        "/reference/design-tokens/Color",
+        "/reference/design-tokens/Spacing",
+        "/reference/design-tokens/Shadow",
+        "/reference/design-tokens/BorderRadius",
+        "/reference/design-tokens/FontFamily",
+        "/reference/design-tokens/FontSize",
+        "/reference/design-tokens/FontWeight",
+        "/reference/design-tokens/LetterSpacing",
+        "/reference/design-tokens/LineHeight",
+    ),
+    "reference.prop_types": (
+        "/reference/prop-types",
+        "/reference/prop-types/{prop_type}",
+    ),
+    "reference.icons": ("/reference/icons",),
+    "reference.env_variables": ("/reference/env-variables",),
+    "reference.cli": ("/reference/cli",),
+}
+
+# redirected path -> the path it redirects to
+route_redirects = {
+    "/": "/introduction/overview",
+    "/introduction": "/introduction/overview",
+    "/guide": "/guide/getting-started",
+}
+
+
+def compile_path(path):
+    return re.compile(re.sub(r"\\{\w+\\}", "[^/]+", re.escape(path)) + "/?$")
+
+
+route_patterns = [
+    (compile_path(path), path, module_name)
+    for module_name, paths in route_modules.items()
+    for path in paths
+]
+
+# Held while importing page modules, so that modules imported by
+# renders and by the background pre-warm register their routes one at a
+# time. The router copies its route tables on write (see `router.py`),
+# so renders never need to hold it while the router runs.
+routes_lock = threading.Lock()
+
+# The page modules that finished importing.
+imported_modules = set()
+
+prewarm_thread = None
+
+
+def import_route_module(module_name):
+    if module_name in imported_modules:
+        return
+    with routes_lock:
+        importlib.import_module(f"{__package__}.pages.{module_name}")
+        imported_modules.add(module_name)
+
+
+def get_route_module(path):
+    """
+    Returns the name of the page module serving `path`, or `None` if no
+    page module serves it.
+    """
+    for pattern, _, module_name in route_patterns:
+        if pattern.match(path):
+            return module_name
+
+
+def load_route(path):
+    """
+    Imports the page module serving `path`, if any, so that its routes
+    are registered before the router runs.
+    """
+    module_name = get_route_module(path)
+    if module_name:
+        import_route_module(module_name)
+
+
+def get_route_template(path):
+    """
+    Returns the declared path in `route_modules` that matches `path`,
+    e.g. "/reference/components/{component_name}", or `None` if no
+    declared path matches.
+    """
+    for pattern, route_path, _ in route_patterns:
+        if pattern.match(path):
+            return route_path
+
+
+def prewarm_enabled():
+    """
+    Background pre-warming is on by default, and can be disabled by
+    setting the `HD_DOCS_PREWARM_ROUTES` environment variable to `"0"`
+    or `"false"`.
+    """
+    return os.environ.get("HD_DOCS_PREWARM_ROUTES", "1").lower() not in (
+        "0",
+        "false",
+    )
+
+
+def prewarm_routes():
+    """
+    Starts a background thread that imports all the page modules that
+    haven't been imported yet, then builds the page outlines and the
+    search index, and warms the docs caches. Only the first call has an
+    effect.
+    """
+    from .outlines import get_page_outlines
+    from .search import get_search_index
+    from .code_examples import warm_doc_cache
+
+    global prewarm_thread
+
+    if prewarm_thread or not prewarm_enabled():
+        return
+
+    def prewarm():
+        for module_name in route_modules:
+            import_route_module(module_name)
+        get_page_outlines()
+        get_search_index()
+        warm_doc_cache()
+
+    prewarm_thread = threading.Thread(target=prewarm, daemon=True)
+    prewarm_thread.start()
+
+
+def check_menu_routes(menu):
+    """
+    Raises `ValueError` if a link in the sidebar `menu` doesn't match
+    any of the paths served by the page modules.
+    """
+    for links in menu.values():
+        for title, info in links.items():
+            if not get_route_template(info["href"]):
+                raise ValueError(
+                    f'The menu link "{title}" points to {info["href"]}, '
+                    "which is not served by any page module."
+                )
@@ -0,0 +1,274 @@
+"""
+Full-text search over the docs.
+
+`get_search_index()` builds an inverted index, once per process, over
+every page's static content (see `page_sources.py`), and over every
+component and prop type in the docs metadata.
+
+Only the metadata documents are stored, alongside the metadata, by
+`docs_metadata.create_docs_metadata()`. The page documents are read
+from the page sources when the index is built, so, like the page
+outlines, they always match the pages being served.
+
+Queries are ranked with BM25, with matches in titles weighted higher.
+Every query word must match, and each word also matches the indexed
+terms it is a prefix of, at a discounted weight, so results update
+usefully as the user types.
+"""
+
+import os
+import re
+import json
+import math
+import bisect
+import pathlib
+from collections import Counter, namedtuple
+from functools import cache, lru_cache
+
+search_index_path = pathlib.Path(os.path.dirname(__file__), "docs_search_index.json")
+
+SEARCH_INDEX_VERSION = 2
+
+# How much more a term occurrence in a document's title counts, versus
+# in its body.
+title_weight = 5
+
+# The weight of a term matched by prefix, relative to an exact match.
+prefix_weight = 0.5
+
+# The max number of indexed terms a query word expands to by prefix.
+max_prefix_expansions = 50
+
+# BM25 parameters
+k1 = 1.2
+b = 0.75
+
+SearchResult = namedtuple("SearchResult", ["path", "title", "kind", "snippet"])
+
+
+def tokenize(text):
+    """
+    Splits `text` into lowercase word terms. Identifiers containing
+    underscores also yield their parts, so `icon_button` matches
+    `button`.
+    """
+    terms = []
+    for word in re.findall(r"\w+", text.lower()):
+        terms.append(word)
+        if "_" in word:
+            terms.extend(part for part in word.split("_") if part)
+    return terms
+
+
+def escape_markdown(text):
+    return re.sub(r"([\\`*_{}\[\]<>()#+\-.!|~])", r"\\\1", text)
+
+
+def to_plain_text(markdown_text):
+    text = re.sub(r"@\w+\((\w+)\)", r"\1", markdown_text)
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    text = re.sub(r"```\S*|[`*#>|]", "", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def get_page_documents():
+    from .page_sources import get_page_blocks
+
+    documents = []
+    for path, blocks in get_page_blocks().items():
+        if "{" in path:
+            continue
+        title = next((text for kind, text in blocks if kind == "title"), path)
+        body = " ".join(
+            to_plain_text(text) for kind, text in blocks if kind != "title"
+        )
+        documents.append(
+            dict(path=path, title=to_plain_text(title), kind="Page", text=body)
+        )
+    return documents
+
+
+def get_metadata_documents(data):
+    documents = []
+
+    for name, component in data["components"].items():
+        parts = [component.get("class_doc"), component["sig"], component.get("doc")]
+        for prop in component.get("props", []):
+            parts += [prop["prop_name"], prop["prop_doc"]]
+        for method in component.get("methods", []):
+            parts += [method["method_name"], method["doc"]]
+        documents.append(
+            dict(
+                path=f"/reference/components/{name}",
+                title=name,
+                kind="Component",
+                text=" ".join(to_plain_text(part) for part in parts if part),
+            )
+        )
+
+    for name, prop_type in data["prop_types"].items():
+        documents.append(
+            dict(
+                path=f"/reference/prop-types/{name}",
+                title=name,
+                kind="Prop Type",
+                text=to_plain_text(prop_type["doc"] or ""),
+            )
+        )
+
+    return documents
+
+
+def write_search_index(data):
+    """
+    Stores the search documents of the docs metadata `data`.
+    """
+    with open(search_index_path, "w") as f:
+        f.write(
+            json.dumps(
+                dict(
+                    version=SEARCH_INDEX_VERSION,
+                    documents=get_metadata_documents(data),
+                )
+            )
+        )
+
+
+class SearchIndex:
+    def __init__(self, documents):
+        self.documents = documents
+        self.lengths = []
+        self.postings = {}
+
+        for doc_id, document in enumerate(documents):
+            counts = Counter(tokenize(document["text"]))
+            for term in tokenize(document["title"]):
+                counts[term] += title_weight
+            self.lengths.append(sum(counts.values()))
+            for term, count in counts.items():
+                self.postings.setdefault(term, []).append((doc_id, count))
+
+        self.terms = sorted(self.postings)
+        self.avg_length = sum(self.lengths) / max(len(self.lengths), 1)
+
+    def expand(self, word):
+        """
+        Returns a list of `(term, weight)` pairs matched by the query
+        word `word`: the word itself, and the terms it is a prefix of.
+        """
+        expansions = []
+        if word in self.postings:
+            expansions.append((word, 1))
+        i = bisect.bisect_left(self.terms, word)
+        while i < len(self.terms) and len(expansions) < max_prefix_expansions:
+            term = self.terms[i]
+            if not term.startswith(word):
+                break
+            if term != word:
+                expansions.append((term, prefix_weight))
+            i += 1
+        return expansions
+
+    def score_word(self, word):
+        """
+        Returns a dict `doc_id -> score` of the documents matching
+        `word`.
+        """
+        scores = {}
+        for term, weight in self.expand(word):
+            posting = self.postings[term]
+            idf = math.log(
+                1 + (len(self.documents) - len(posting) + 0.5) / (len(posting) + 0.5)
+            )
+            for doc_id, count in posting:
+                norm = 1 - b + b * self.lengths[doc_id] / self.avg_length
+                score = weight * idf * count * (k1 + 1) / (count + k1 * norm)
+                scores[doc_id] = max(scores.get(doc_id, 0), score)
+        return scores
+
+    def snippet(self, text, words, width=160):
+        """
+        Returns an excerpt of `text` around the first match of any of
+        `words`, as markdown, with the matches highlighted in bold and
+        the rest of the text escaped.
+        """
+        pattern = re.compile(
+            r"\b(" + "|".join(re.escape(w) for w in words) + r")\w*", re.IGNORECASE
+        )
+        match = pattern.search(text)
+        start = max(0, match.start() - width // 3) if match else 0
+        if start > 0:
+            start = text.find(" ", start) + 1
+        excerpt = text[start : start + width]
+        if start + width < len(text):
+            excerpt = excerpt[: excerpt.rfind(" ")] + " ..."
+        if start > 0:
+            excerpt = "... " + excerpt
+        parts = []
+        end = 0
+        for match in pattern.finditer(excerpt):
+            parts.append(escape_markdown(excerpt[end : match.start()]))
+            parts.append(f"**{escape_markdown(match.group(0))}**")
+            end = match.end()
+        parts.append(escape_markdown(excerpt[end:]))
+        return "".join(parts)
+
+    @lru_cache(maxsize=1024)
+    def search(self, query, limit=10):
+        """
+        Returns a tuple of up to `limit` `SearchResult`s for `query`,
+        best match first.
+        """
+        words = list(dict.fromkeys(tokenize(query)))
+        if not words:
+            return ()
+
+        total = None
+        for word in words:
+            scores = self.score_word(word)
+            if total is None:
+                total = scores
+            else:
+                total = {
+                    doc_id: score + scores[doc_id]
+                    for doc_id, score in total.items()
+                    if doc_id in scores
+                }
+            if not total:
+                return ()
+
+        ranked = sorted(total.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return tuple(
+            SearchResult(
+                path=self.documents[doc_id]["path"],
+                title=self.documents[doc_id]["title"],
+                kind=self.documents[doc_id]["kind"],
+                snippet=self.snippet(self.documents[doc_id]["text"], words),
+            )
+            for doc_id, _ in ranked
+        )
+
+
+def load_metadata_documents():
+    """
+    Returns the stored metadata search documents, or builds them from
+    the current docs metadata if they weren't stored.
+    """
+    if search_index_path.exists():
+        with open(search_index_path) as f:
+            index = json.loads(f.read())
+        if index.get("version") == SEARCH_INDEX_VERSION:
+            return index["documents"]
+
+    from .docs_metadata import get_docs_metadata
+
+    return get_metadata_documents(get_docs_metadata())
+
+
+@cache
+def get_search_index():
+    """
+    Returns the process-wide `SearchIndex`, over the page documents
+    read from the page sources and the stored metadata documents.
+    """
+    return SearchIndex(get_page_documents() + load_metadata_documents())
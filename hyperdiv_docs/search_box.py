@@ -0,0 +1,54 @@
+import hyperdiv as hd
+from .search import get_search_index
+
+
+def render_search_result(result):
+    with hd.link(
+        href=result.path,
+        font_color="neutral-900",
+        padding=0.5,
+        border_radius="medium",
+    ):
+        with hd.hbox(gap=0.5, align="center"):
+            hd.text(result.title, font_weight="bold")
+            hd.badge(
+                result.kind,
+                variant="neutral",
+                font_size=0.7,
+                padding=(0, 0.3, 0, 0.3),
+            )
+        hd.markdown(result.snippet, font_size=0.8, font_color="neutral-700")
+
+
+def search_box():
+    """
+    Renders a search button, which opens a dialog for searching across
+    all the docs pages, components and prop types.
+    """
+    state = hd.state(path=None)
+    loc = hd.location()
+
+    search_clicked = hd.button("Search", prefix_icon="search", size="small").clicked
+    dialog = hd.dialog("Search the docs")
+
+    if search_clicked:
+        dialog.opened = True
+        state.path = loc.path
+    elif dialog.opened and loc.path != state.path:
+        # The user navigated to a search result.
+        dialog.opened = False
+
+    with dialog:
+        search_input = hd.text_input(
+            placeholder="Search",
+            prefix_icon="search",
+            clearable=True,
+        )
+        if search_input.value:
+            results = get_search_index().search(search_input.value)
+            with hd.box(gap=0.5, padding_top=1):
+                if not results:
+                    hd.text("No results.", font_color="neutral-600")
+                for result in results:
+                    with hd.scope(result.path):
+                        render_search_result(result)
@@ -0,0 +1,225 @@
+"""
+Builds static HTML snapshots of the docs site, one per route, for
+serving first-load and crawler traffic without opening a live Hyperdiv
+session.
+
+Hyperdiv renders pages in the browser from a component tree sent over
+the websocket, so snapshots are generated from the statically known
+content instead: the literal markdown and code of each page (see
+`page_sources.py`), and the docs metadata for component and prop type
+pages. Interactive content, like live code examples and the icon
+browser, is omitted.
+
+Each snapshot is written to `<out_dir>/<route path>/index.html`.
+Paths that the router redirects from, like `/`, get a snapshot of the
+page they redirect to. When the user activates a link or the "Open the
+interactive page" button in a snapshot, the browser loads the link's
+path, or the same path for the button, with a `live` query parameter,
+which the fronting server can use to route the request to the live
+app. Scrolling, selecting text, and other interactions stay on the
+snapshot.
+
+Run `python -m hyperdiv_docs.snapshots [out_dir]` to build the
+snapshots. Markdown is rendered with Hyperdiv's own Markdown parser,
+so snapshot HTML matches what the live app renders.
+"""
+
+import os
+import sys
+import html
+import pathlib
+from hyperdiv.components.markdown import parse_markdown
+from .menu import menu
+from .routes import route_redirects
+from .page_sources import get_page_blocks
+from .cross_references import rewrite_references
+from .docs_metadata import (
+    get_docs_metadata_index,
+    get_component_metadata,
+    get_prop_type_metadata,
+)
+from .utils import render_value
+
+snapshots_path = pathlib.Path(os.path.dirname(__file__), "static_snapshots")
+
+description = "Learn how to use the Hyperdiv web framework"
+
+# Link clicks and keyboard activations both dispatch `click`.
+live_script = """
+(function () {
+  document.addEventListener("click", function (e) {
+    var target = e.target.closest("a[href], button[data-live]");
+    if (!target) return;
+    var url = new URL(target.href || window.location.href);
+    if (url.origin !== window.location.origin) return;
+    if (target.href && url.pathname === window.location.pathname && url.hash) {
+      return;
+    }
+    e.preventDefault();
+    url.searchParams.set("live", "1");
+    window.location.assign(url);
+  });
+})();
+"""
+
+live_button = '<button type="button" data-live>Open the interactive page</button>'
+
+
+def render_markdown(text):
+    text = rewrite_references(text)
+    return parse_markdown(text)
+
+
+def render_code(code):
+    return f"<pre><code>{html.escape(code.strip())}</code></pre>"
+
+
+def render_blocks(blocks):
+    parts = []
+    for kind, text in blocks:
+        if kind == "code":
+            parts.append(render_code(text))
+        else:
+            parts.append(render_markdown(text))
+    return "\n".join(parts)
+
+
+def get_title(blocks, default):
+    for kind, text in blocks:
+        if kind == "title":
+            return text.strip().lstrip("#").strip().strip("`")
+    return default
+
+
+def render_component_page(component_name):
+    component = get_component_metadata(component_name)
+    blocks = [("title", f"# `{component_name}`")]
+
+    if component["component_type"] == "class" and component["class_doc"]:
+        blocks.append(("markdown", component["class_doc"]))
+
+    blocks.append(("code", component["sig"]))
+
+    if component["doc"]:
+        blocks.append(("markdown", component["doc"]))
+
+    if component["component_type"] == "class":
+        if component["props"]:
+            blocks.append(("markdown", "### Props"))
+            for prop in component["props"]:
+                default_value = render_value(prop["default_value"])
+                blocks.append(("code", f"{prop['prop_name']} = {default_value}"))
+                blocks.append(("markdown", f"type: {prop['markdown']}"))
+                if prop["prop_doc"]:
+                    blocks.append(("markdown", prop["prop_doc"]))
+        if component["methods"]:
+            blocks.append(("markdown", "### Methods"))
+            for method in component["methods"]:
+                blocks.append(("code", method["sig"]))
+                if method["doc"]:
+                    blocks.append(("markdown", method["doc"]))
+
+    return blocks
+
+
+def render_prop_type_page(prop_type_name):
+    prop_type = get_prop_type_metadata(prop_type_name)
+    blocks = [("title", f"# `{prop_type_name}`")]
+
+    if prop_type["doc"]:
+        blocks.append(("markdown", prop_type["doc"]))
+
+    if prop_type["is_alias"]:
+        blocks.append(("markdown", "### Type Definition:"))
+        blocks.append(("markdown", f"{prop_type_name} = {prop_type['markdown']}"))
+
+    return blocks
+
+
+def get_snapshot_pages():
+    """
+    Returns a dict `path -> blocks` for every route that can be
+    snapshotted: every concrete route in the page modules, and every
+    component and prop type page implied by the docs metadata.
+    """
+    pages = {
+        path: blocks for path, blocks in get_page_blocks().items() if "{" not in path
+    }
+
+    index = get_docs_metadata_index()
+    for component_name in index["components"]:
+        pages[f"/reference/components/{component_name}"] = render_component_page(
+            component_name
+        )
+    for prop_type_name in index["prop_types"]:
+        pages[f"/reference/prop-types/{prop_type_name}"] = render_prop_type_page(
+            prop_type_name
+        )
+
+    return pages
+
+
+def render_nav():
+    parts = ["<nav>"]
+    for section, links in menu.items():
+        parts.append(f"<h4>{html.escape(section)}</h4><ul>")
+        for link_name, info in links.items():
+            parts.append(
+                f'<li><a href="{info["href"]}">{html.escape(link_name)}</a></li>'
+            )
+        parts.append("</ul>")
+    parts.append("</nav>")
+    return "".join(parts)
+
+
+def render_snapshot(path, blocks, nav):
+    title = html.escape(get_title(blocks, "Hyperdiv Docs"))
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} - Hyperdiv Docs</title>
+<meta name="description" content="{description}">
+<link rel="canonical" href="{path}">
+<link rel="icon" href="/assets/hd-logo-white.svg">
+</head>
+<body>
+{nav}
+<main>
+{live_button}
+{render_blocks(blocks)}
+</main>
+<script>{live_script}</script>
+</body>
+</html>
+"""
+
+
+def build_snapshots(out_dir=snapshots_path):
+    """
+    Writes the snapshots into `out_dir`, overwriting existing
+    snapshots. Returns the list of paths that were snapshotted.
+    """
+    out_dir = pathlib.Path(out_dir)
+    nav = render_nav()
+    pages = get_snapshot_pages()
+
+    # snapshot path -> the canonical path of its page
+    snapshot_paths = {path: path for path in pages}
+    for redirect, path in route_redirects.items():
+        if path in pages:
+            snapshot_paths[redirect] = path
+
+    for snapshot_path, path in snapshot_paths.items():
+        page_dir = out_dir / snapshot_path.strip("/")
+        os.makedirs(page_dir, exist_ok=True)
+        with open(page_dir / "index.html", "w", encoding="utf-8") as f:
+            f.write(render_snapshot(path, pages[path], nav))
+
+    return list(snapshot_paths)
+
+
+if __name__ == "__main__":
+    paths = build_snapshots(sys.argv[1] if len(sys.argv) > 1 else snapshots_path)
+    print(f"Wrote {len(paths)} snapshots.")
@@ -0,0 +1,79 @@
+from collections.abc import Sequence
+import hyperdiv as hd
+
+
+class ChainedSequence(Sequence):
+    """
+    A read-only concatenation of sequences. Slicing it slices the
+    underlying sequences, so lazily-decoded sequences, like mapped
+    metadata lists, only decode the items within the slice.
+    """
+
+    def __init__(self, *sequences):
+        self.sequences = sequences
+
+    def __len__(self):
+        return sum(len(sequence) for sequence in self.sequences)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return [self[j] for j in range(start, stop, step)]
+            items = []
+            for sequence in self.sequences:
+                length = len(sequence)
+                if start < length and stop > 0:
+                    items.extend(sequence[max(start, 0) : min(stop, length)])
+                start -= length
+                stop -= length
+            return items
+
+        if i < 0:
+            i += len(self)
+        if i >= 0:
+            for sequence in self.sequences:
+                if i < len(sequence):
+                    return sequence[i]
+                i -= len(sequence)
+        raise IndexError(i)
+
+
+def windowed_list(items, render_item, page_size=20, key=None, gap=1):
+    """
+    Renders a window of the first `page_size` items of the sequence
+    `items`, calling `render_item(item)` for each, followed by buttons
+    that grow the window by `page_size` items or show all the items.
+    Items outside the window are never rendered, so long lists don't
+    produce large component trees up front.
+
+    The window is reset when `key` changes, e.g. when the same list
+    call site renders the items of a different component.
+
+    Each call site of `windowed_list` should be in its own
+    `hd.scope`, and `render_item` should scope each item uniquely.
+    """
+    # `key` is reserved by `hd.state`, so the window's key is stored
+    # as `list_key`.
+    state = hd.state(list_key=None, visible=page_size)
+    if state.list_key != key:
+        state.list_key = key
+        state.visible = page_size
+
+    with hd.box(gap=gap):
+        # Slicing `items` only decodes the visible items of mapped
+        # metadata lists.
+        for item in items[: state.visible]:
+            render_item(item)
+
+        remaining = len(items) - state.visible
+        if remaining > 0:
+            with hd.hbox(gap=1, align="center"):
+                if hd.button(
+                    f"Show {min(remaining, page_size)} More", size="small"
+                ).clicked:
+                    state.visible += page_size
+                if hd.button(
+                    f"Show All {len(items)}", size="small", variant="text"
+                ).clicked:
+                    state.visible = len(items)
@@ -1,5 +1,8 @@
 import hyperdiv as hd
 from hyperdiv_docs.main import main
+from hyperdiv_docs.menu import menu
+from hyperdiv_docs.routes import check_menu_routes
+from hyperdiv_docs.profiler import start_metrics_server
 
 index_page = hd.index_page(
     title="Hyperdiv Docs",
@@ -8,5 +11,7 @@ index_page = hd.index_page(
     favicon="/assets/hd-logo-white.svg",
 )
 
+check_menu_routes(menu)
+start_metrics_server()
 
 hd.run(main, index_page=index_page)
@@ -0,0 +1,23 @@
+from hyperdiv_docs.menu import menu
+from hyperdiv_docs.page_sources import get_module_routes
+from hyperdiv_docs.routes import route_modules, route_redirects, check_menu_routes
+
+
+def test_route_table_matches_decorators():
+    redirects = {}
+    for module_name, paths in route_modules.items():
+        module_routes = get_module_routes(module_name)
+        assert paths == tuple(
+            served_path
+            for path, redirect_from in module_routes
+            for served_path in (path,) + redirect_from
+        ), module_name
+        for path, redirect_from in module_routes:
+            for redirect in redirect_from:
+                redirects[redirect] = path
+
+    assert route_redirects == redirects
+
+
+def test_menu_routes():
+    check_menu_routes(menu)
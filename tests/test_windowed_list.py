@@ -0,0 +1,58 @@
+import hyperdiv as hd
+from hyperdiv.test_utils import MockManualRunner
+from hyperdiv_docs.windowed_list import windowed_list, ChainedSequence
+
+
+def test_windowed_list():
+    rendered = []
+    button_keys = []
+    button_labels = []
+
+    def app():
+        rendered.clear()
+        button_keys.clear()
+        button_labels.clear()
+
+        def render_item(item):
+            with hd.scope(item):
+                hd.text(item)
+            rendered.append(item)
+
+        with hd.box() as root:
+            windowed_list(
+                list(range(25)), render_item, page_size=10, key=hd.window().width
+            )
+
+        for child in root.children[0].children[-1].children:
+            if isinstance(child, hd.button):
+                button_keys.append(child._key)
+                button_labels.append(child.label)
+
+    mr = MockManualRunner(app)
+    mr.advance()
+    assert rendered == list(range(10))
+    assert button_labels == ["Show 10 More", "Show All 25"]
+    more_key, all_key = button_keys
+
+    mr.process_updates([(more_key, "clicked", True)])
+    assert rendered == list(range(20))
+    assert button_labels == ["Show 5 More", "Show All 25"]
+
+    mr.process_updates([(all_key, "clicked", True)])
+    assert rendered == list(range(25))
+    assert button_labels == []
+
+    # Changing the key resets the window.
+    mr.process_updates([("window", "width", 1000)])
+    assert rendered == list(range(10))
+
+
+def test_chained_sequence():
+    chained = ChainedSequence([0, 1, 2], [], [3, 4])
+    assert len(chained) == 5
+    assert list(chained) == [0, 1, 2, 3, 4]
+    assert chained[:2] == [0, 1]
+    assert chained[2:4] == [2, 3]
+    assert chained[1:] == [1, 2, 3, 4]
+    assert chained[-1] == 4
+    assert chained[::2] == [0, 2, 4]